@@ -0,0 +1,90 @@
+from camera import value_range, window_around
+from surface_cache import text_cache
+
+# --- HUD Array Strip ---
+# The HUD shows the array being sorted as a row of fixed-width cells. Only
+# as many cells as fit on screen are drawn, in a window that scrolls to
+# keep the active index centered, and every cell keeps its own rendered
+# glyph: a frame re-renders only the cells whose text changed (the two
+# values in a swap, or the markers moving with the index) and blits the rest.
+
+CELL_GAP = 8 # Pixels between neighbouring cells
+ELLIPSIS = "..."
+
+
+class ArrayStrip:
+    """A one-line, scrollable view of an array with a glyph per cell.
+
+    Cells are as wide as the widest value the array can hold (with marker
+    brackets) and each value is centered in its cell, so nothing shifts as
+    values are swapped. Cells listed in `marked` are drawn as "[value]".
+    """
+    def __init__(self, pos, width, color, label):
+        self.pos = pos
+        self.width = width
+        self.color = color
+        self.label = label
+        self.renders = 0 # Cell glyphs rendered
+        self.reuses = 0 # Cell glyphs blitted from the cache
+        self._font = None
+        self._layout = None # (total, pitch, cell count)
+        self._cells = {} # index -> (text, surface)
+
+    def _set_font(self, font):
+        if font is not self._font:
+            self._font = font
+            self._layout = None
+            self._cells.clear()
+
+    def _fit(self, font, total):
+        """Cell pitch and how many cells fit beside the label and ellipses."""
+        if self._layout is None or self._layout[0] != total:
+            widest = font.size(f"[{value_range(total)[-1]}]")[0]
+            pitch = widest + CELL_GAP
+            room = self.width - font.size(f"{self.label} {ELLIPSIS} ")[0] - font.size(f" {ELLIPSIS}")[0]
+            self._layout = (total, pitch, max(1, room // pitch))
+        return self._layout[1], self._layout[2]
+
+    def window(self, font, total, center):
+        """The range of indices shown when centered on `center`."""
+        self._set_font(font)
+        _, count = self._fit(font, total)
+        return window_around(center, count, total)
+
+    def draw(self, screen, font, array, center, marked=()):
+        shown = self.window(font, len(array), center)
+        pitch, _ = self._fit(font, len(array))
+
+        # Forget cells that scrolled out of view so the cache stays window-sized
+        cells = self._cells
+        if len(cells) > len(shown):
+            for i in [i for i in cells if i not in shown]:
+                del cells[i]
+
+        x, y = self.pos
+        label_surf = text_cache.render(font, self.label, True, self.color)
+        screen.blit(label_surf, (x, y))
+        x += label_surf.get_width() + CELL_GAP
+        ellipsis = text_cache.render(font, ELLIPSIS, True, self.color)
+        if shown.start > 0:
+            screen.blit(ellipsis, (x, y))
+            x += ellipsis.get_width() + CELL_GAP
+
+        for i in shown:
+            text = f"[{array[i]}]" if i in marked else str(array[i])
+            cell = cells.get(i)
+            if cell is None or cell[0] != text:
+                cell = cells[i] = (text, font.render(text, True, self.color))
+                self.renders += 1
+            else:
+                self.reuses += 1
+            screen.blit(cell[1], (x + (pitch - CELL_GAP - cell[1].get_width()) // 2, y))
+            x += pitch
+
+        if shown.stop < len(array):
+            screen.blit(ellipsis, (x, y))
+
+    def invalidate(self):
+        """Drops every cached glyph, e.g. after the font is reloaded."""
+        self._cells.clear()
+        self._layout = None
@@ -0,0 +1,179 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+from bots import POLICIES
+from camera import LAYOUTS, MAX_ARRAY_SIZE
+from profiler import percentile
+from replay import GAMES, game_class
+from simulation import Simulator
+
+# --- Batch Evaluation ---
+# Plays many seeded games headlessly under a bot policy, spread over a
+# process pool, to see how long each level takes. Every game reports the
+# ticks it took and how far the player walked; results stream back as they
+# finish and are summarised per (game, size, layout, policy) as percentiles
+# and a histogram.
+#
+#   python batch.py --game gnome --sizes 8 16 32 --games 1000
+#   python batch.py --layouts random reversed --policy axis --out results.json
+
+PERCENTILES = (5, 25, 50, 75, 95, 99)
+HISTOGRAM_BINS = 10
+HISTOGRAM_WIDTH = 40
+DEFAULT_MAX_TICKS = 1_000_000
+
+
+def play_game(job):
+    """Plays one game to the end with a bot; runs in a worker process."""
+    game_name, size, layout, policy_name, seed, max_ticks = job
+    game = game_class(game_name)(seed=seed, size=size, layout=layout)
+    player = getattr(game, GAMES[game_name][2])
+    simulator = Simulator(game, policy=POLICIES[game_name][policy_name])
+
+    travel = 0.0
+    start = time.perf_counter()
+    while not game.finished and simulator.ticks < max_ticks:
+        simulator.advance(1)
+        travel += math.hypot(player.x - player.prev_x, player.y - player.prev_y)
+    return {
+        "game": game_name, "size": size, "layout": layout, "policy": policy_name, "seed": seed,
+        "finished": game.finished, "ticks": simulator.ticks, "travel": round(travel, 1),
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def histogram(values, bins=HISTOGRAM_BINS):
+    """Equal-width histogram of values as [(low, high, count)]."""
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    width = (high - low) / bins or 1
+    counts = [0] * bins
+    for value in values:
+        counts[min(bins - 1, int((value - low) / width))] += 1
+    return [(low + i * width, low + (i + 1) * width, count) for i, count in enumerate(counts)]
+
+
+def describe(values, bins=HISTOGRAM_BINS):
+    """Mean, percentiles and histogram of one metric."""
+    ordered = sorted(values)
+    return {
+        "mean": round(sum(ordered) / len(ordered), 1) if ordered else None,
+        "percentiles": {f"p{p}": percentile(ordered, p) for p in PERCENTILES},
+        "histogram": [[round(low, 1), round(high, 1), count] for low, high, count in histogram(ordered, bins)],
+    }
+
+
+class BatchSummary:
+    """Accumulates per-game results by (game, size, layout, policy)."""
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, result):
+        key = (result["game"], result["size"], result["layout"], result["policy"])
+        group = self.groups.setdefault(key, {"ticks": [], "travel": [], "unfinished": 0})
+        if not result["finished"]:
+            group["unfinished"] += 1
+            return
+        group["ticks"].append(result["ticks"])
+        group["travel"].append(result["travel"])
+
+    def summary(self, bins=HISTOGRAM_BINS):
+        return [
+            {"game": game, "size": size, "layout": layout, "policy": policy,
+             "games": len(group["ticks"]) + group["unfinished"], "unfinished": group["unfinished"],
+             "ticks": describe(group["ticks"], bins),
+             "travel": describe(group["travel"], bins)}
+            for (game, size, layout, policy), group in sorted(self.groups.items())
+        ]
+
+
+def format_group(group):
+    lines = [f"== {group['game']} size={group['size']} layout={group['layout']} policy={group['policy']}: "
+             f"{group['games']} games, {group['unfinished']} unfinished"]
+    for metric in ("ticks", "travel"):
+        data = group[metric]
+        if data["mean"] is None:
+            continue
+        pcts = "  ".join(f"{name}={value:g}" for name, value in data["percentiles"].items())
+        lines.append(f"  {metric:<6} mean={data['mean']:g}  {pcts}")
+        peak = max(count for _, _, count in data["histogram"]) or 1
+        for low, high, count in data["histogram"]:
+            bar = "#" * round(HISTOGRAM_WIDTH * count / peak)
+            lines.append(f"    {low:>10.1f} - {high:<10.1f} {count:>6} {bar}")
+    return "\n".join(lines)
+
+
+def iter_results(jobs, workers):
+    """Yields each game's result as soon as it finishes, in any order."""
+    if workers == 1:
+        for job in jobs:
+            yield play_game(job)
+        return
+    # Small chunks keep results streaming back; large enough to amortise IPC
+    chunksize = max(1, min(64, len(jobs) // (workers * 8)))
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap_unordered(play_game, jobs, chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many seeded games with a bot across all cores.")
+    parser.add_argument("--game", nargs="+", choices=sorted(GAMES), default=sorted(GAMES), help="levels to play")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[8], help="array sizes to play")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=["random"], help="starting array orders")
+    parser.add_argument("--policy", nargs="+", choices=sorted(POLICIES["gnome"]), default=["straight"],
+                        help="bot steering: straight at the target, or horizontal first then vertical")
+    parser.add_argument("--games", type=int, default=1000, help="seeded games per combination")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS,
+                        help="give up on a game after this many ticks")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all cores; 1 runs in this process)")
+    parser.add_argument("--bins", type=int, default=HISTOGRAM_BINS, help="histogram buckets")
+    parser.add_argument("--out", metavar="OUT.json", help="write the summary as JSON")
+    parser.add_argument("--results", metavar="OUT.jsonl", help="stream every game's result, one JSON object per line")
+    args = parser.parse_args(argv)
+    if any(not 2 <= size <= MAX_ARRAY_SIZE for size in args.sizes):
+        parser.error(f"--sizes must be between 2 and {MAX_ARRAY_SIZE}")
+    if args.games < 0:
+        parser.error("--games can't be negative")
+    if args.max_ticks < 1:
+        parser.error("--max-ticks must be at least 1")
+    if args.bins < 1:
+        parser.error("--bins must be at least 1")
+
+    jobs = [(game, size, layout, policy, seed, args.max_ticks)
+            for game in args.game for size in args.sizes for layout in args.layouts for policy in args.policy
+            for seed in range(args.first_seed, args.first_seed + args.games)]
+    summary = BatchSummary()
+    results_file = open(args.results, "w") if args.results else None
+    start = time.perf_counter()
+    progress_every = max(1, len(jobs) // 20)
+    try:
+        for done, result in enumerate(iter_results(jobs, max(1, args.workers)), 1):
+            summary.add(result)
+            if results_file is not None:
+                results_file.write(json.dumps(result) + "\n")
+            if done % progress_every == 0 or done == len(jobs):
+                print(f"\r{done}/{len(jobs)} games in {time.perf_counter() - start:.1f}s", end="", file=sys.stderr)
+    finally:
+        if results_file is not None:
+            results_file.close()
+    print(file=sys.stderr)
+
+    groups = summary.summary(args.bins)
+    for group in groups:
+        print(format_group(group))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"args": vars(args), "groups": groups}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Micro-benchmark: MinSegmentTree vs rescanning the suffix every pass.
+
+Plays out the selection sort passes of SelectionSortGame.start_new_pass on
+random arrays (with and without duplicate values) and times both. That
+the tree picks the same indices as the scan is checked by
+tests/test_min_tree.py.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_min_tree
+"""
+import random
+import time
+
+from min_tree import MinSegmentTree
+
+SIZES = (10, 1_000, 10_000)
+
+
+def scan_argmin(array, start):
+    """The original left-to-right scan from start_new_pass."""
+    min_val = array[start]
+    min_index = start
+    for i in range(start + 1, len(array)):
+        if array[i] < min_val:
+            min_val = array[i]
+            min_index = i
+    return min_index
+
+
+def sort_with_scan(array):
+    for start in range(len(array) - 1):
+        i = scan_argmin(array, start)
+        array[start], array[i] = array[i], array[start]
+
+
+def sort_with_tree(array):
+    tree = MinSegmentTree(array)
+    for start in range(len(array) - 1):
+        i = tree.argmin(start)
+        array[start], array[i] = array[i], array[start]
+        tree.update(start)
+        tree.update(i)
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'size':>8} {'values':>10} {'scan':>10} {'tree':>10}")
+    for total in SIZES:
+        for label, high in (("distinct", None), ("ties", max(2, total // 10))):
+            if high is None:
+                array = rng.sample(range(10 * total), total)
+            else:
+                array = [rng.randrange(high) for _ in range(total)]
+
+            start = time.perf_counter()
+            sort_with_scan(list(array))
+            scan_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            sort_with_tree(list(array))
+            tree_time = time.perf_counter() - start
+
+            print(f"{total:>8} {label:>10} {scan_time * 1000:>8.1f}ms {tree_time * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
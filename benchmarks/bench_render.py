@@ -0,0 +1,251 @@
+"""Headless rendering and playthrough benchmarks for both games.
+
+Runs under SDL's dummy video driver, so no display is needed. For each
+array size it measures building a game, the steady-state frame (scene
+building plus a full redraw of the pots/blocks and HUD) and the HUD on its
+own, then plays one scripted game of each kind end to end while rendering
+every tick. Timings are taken with tracemalloc off; peak memory comes from
+a separate traced run.
+
+Results are written as JSON and compared against a stored baseline; any
+case that got slower (or used more memory) by more than the threshold is
+reported and the script exits non-zero.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render                    # compare with baseline
+    python -m benchmarks.bench_render --update-baseline  # record a new baseline
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import gnome_sorter_game as gnome_game
+import insertionsort as selection_game
+from bots import gnome_sort_bot, selection_sort_bot
+from camera import Camera
+from renderer import SceneRenderer
+from simulation import Simulator
+
+SIZES = (8, 100, 1_000, 10_000, 100_000)
+QUICK_SIZES = (8, 1_000)
+FRAMES = 120
+REPEATS = 5 # Timings report the best repeat, as timeit does, to damp noise
+MEMORY_FRAMES = 10
+PLAYTHROUGH_MAX_TICKS = 100_000
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+MIN_REGRESSION_MS = 1.0 # Ignore slowdowns smaller than this; they are timer noise
+
+
+def traced_peak_kib(fn):
+    """Runs fn under tracemalloc; returns (fn's result, peak KiB allocated)."""
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, round(peak / 1024, 1)
+
+
+def best_time(fn, repeats=REPEATS):
+    """Fastest of several timed calls of fn, in seconds, with GC paused."""
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def measure(run_frame, frames):
+    """Times `frames` calls of run_frame, then re-runs a few under tracemalloc."""
+    run_frame() # Warm the text and overlay caches
+    elapsed = best_time(lambda: [run_frame() for _ in range(frames)])
+    _, peak_kib = traced_peak_kib(lambda: [run_frame() for _ in range(MEMORY_FRAMES)])
+
+    ms_per_frame = elapsed / frames * 1000
+    return {
+        "ms_per_frame": round(ms_per_frame, 4),
+        "fps": round(1000 / ms_per_frame, 1) if ms_per_frame else None,
+        "peak_kib": peak_kib,
+    }
+
+
+class GameHarness:
+    """The per-game pieces a benchmark needs, behind one interface."""
+    def __init__(self, name, module, game_class, bot, actor, fonts):
+        self.name = name
+        self.module = module
+        self.game_class = game_class
+        self.bot = bot
+        self.actor = actor
+        self.fonts = fonts
+
+    def new_game(self, size, seed=0):
+        return self.game_class(seed=seed, size=size)
+
+    def frame_runner(self, screen, game):
+        """A function drawing one frame of game, walking the camera along the row."""
+        module = self.module
+        camera = Camera(module.SCREEN_WIDTH, game.world_width, game.spacing, game.detail_spacing)
+        renderer = SceneRenderer(screen, module.COLOR_BACKGROUND, static_keys=module.STATIC_SPRITES)
+        actor = getattr(game, self.actor)
+        step = max(1, game.world_width // (FRAMES * 4))
+
+        def run_frame():
+            actor.x = actor.prev_x = (actor.x + step) % game.world_width
+            camera.follow(actor.x)
+            renderer.render(module.build_scene(game, camera, *self.fonts))
+        return run_frame
+
+    def hud_runner(self, screen, game):
+        module = self.module
+        title_font, text_font = self.fonts[:2]
+        if self.name == "gnome":
+            args = (game.objective, game.array_to_sort, game.sort_index, game.state)
+        else:
+            args = (game.objective, game.array_to_sort, game.current_pass_index)
+        return lambda: module.draw_hud(screen, title_font, text_font, *args)
+
+    def play(self, screen):
+        """Plays one seeded game with the bot, rendering every tick.
+
+        Returns the tick count and the renderer's background layer hit rate.
+        """
+        module = self.module
+        game = self.new_game(8)
+        camera = Camera(module.SCREEN_WIDTH, game.world_width, game.spacing, game.detail_spacing)
+        renderer = SceneRenderer(screen, module.COLOR_BACKGROUND, static_keys=module.STATIC_SPRITES)
+        simulator = Simulator(game, policy=self.bot)
+        while not game.finished and simulator.ticks < PLAYTHROUGH_MAX_TICKS:
+            simulator.advance(1)
+            camera.follow(getattr(game, self.actor).x)
+            renderer.render(module.build_scene(game, camera, *self.fonts))
+        if not game.finished:
+            raise RuntimeError(f"{self.name} bot did not finish within {PLAYTHROUGH_MAX_TICKS} ticks")
+        return simulator.ticks, renderer.layer_hit_rate
+
+    def playthrough(self, screen):
+        ticks, layer_hit_rate = self.play(screen)
+        elapsed = best_time(lambda: self.play(screen), repeats=3)
+        _, peak_kib = traced_peak_kib(lambda: self.play(screen))
+        return {
+            "ticks": ticks,
+            "ms_per_frame": round(elapsed / ticks * 1000, 4),
+            "fps": round(ticks / elapsed, 1),
+            "peak_kib": peak_kib,
+            "layer_hit_rate": round(layer_hit_rate, 3),
+        }
+
+
+def run_benchmarks(sizes, log=print):
+    pygame.init()
+    screen = pygame.display.set_mode((gnome_game.SCREEN_WIDTH, gnome_game.SCREEN_HEIGHT))
+    harnesses = [
+        GameHarness("gnome", gnome_game, gnome_game.GnomeSortGame, gnome_sort_bot, "gnome",
+                    (pygame.font.Font(None, 50), pygame.font.Font(None, 32), pygame.font.Font(None, 40))),
+        GameHarness("selection", selection_game, selection_game.SelectionSortGame, selection_sort_bot, "sorter",
+                    (pygame.font.Font(None, 50), pygame.font.Font(None, 32), pygame.font.Font(None, 45))),
+    ]
+
+    results = {}
+    for harness in harnesses:
+        for size in sizes:
+            elapsed = best_time(lambda: harness.new_game(size), repeats=REPEATS if size <= 10_000 else 2)
+            game, peak_kib = traced_peak_kib(lambda: harness.new_game(size))
+            name = f"{harness.name}.setup[{size}]"
+            results[name] = {"ms": round(elapsed * 1000, 3), "peak_kib": peak_kib}
+            log(f"{name:<28} {results[name]['ms']:>9.3f} ms {results[name]['peak_kib']:>10.1f} KiB")
+
+            for case, runner in (("frame", harness.frame_runner(screen, game)),
+                                 ("hud", harness.hud_runner(screen, game))):
+                name = f"{harness.name}.{case}[{size}]"
+                results[name] = measure(runner, FRAMES)
+                log(f"{name:<28} {results[name]['ms_per_frame']:>9.3f} ms {results[name]['peak_kib']:>10.1f} KiB")
+        name = f"{harness.name}.playthrough"
+        results[name] = harness.playthrough(screen)
+        log(f"{name:<28} {results[name]['ms_per_frame']:>9.3f} ms {results[name]['peak_kib']:>10.1f} KiB"
+            f"  ({results[name]['ticks']} ticks, layer hit rate {results[name]['layer_hit_rate']:.1%})")
+    pygame.quit()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns human-readable lines for every case that regressed past threshold."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ("ms_per_frame", "ms", "peak_kib"):
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None or new <= old * (1 + threshold):
+                continue
+            if metric != "peak_kib" and new - old < MIN_REGRESSION_MS:
+                continue
+            regressions.append(f"{name} {metric}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="bench_output.json", help="where to write this run's results")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown/growth before a case counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--quick", action="store_true", help=f"only run sizes {QUICK_SIZES}")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(QUICK_SIZES if args.quick else SIZES)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Micro-benchmark: SlotStore memory and relayout vs one object per element.
+
+The reference layout is what pots and blocks used to be: a Python object
+with a __dict__ per element plus a separate list of values.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_slot_store
+"""
+import timeit
+import tracemalloc
+
+from camera import slot_spacing
+from gnome_sorter_game import FlowerPot, POT_MIN_SPACING, SCREEN_HEIGHT, SCREEN_WIDTH
+from slot_store import SlotStore
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+class ObjectSlot:
+    """An element stored the old way, for comparison."""
+    def __init__(self, value, pos_index, spacing):
+        self.value = value
+        self.pos_index = pos_index
+        self.offset_x = 0.0
+        self.relayout(spacing)
+
+    def relayout(self, spacing):
+        self.x = int(spacing * (self.pos_index + 1))
+        self.y = int(SCREEN_HEIGHT / 2)
+
+
+def build_objects(values, spacing):
+    return list(values), [ObjectSlot(value, i, spacing) for i, value in enumerate(values)]
+
+
+def build_store(values, spacing):
+    return SlotStore(FlowerPot, values, spacing, int(SCREEN_HEIGHT / 2))
+
+
+def traced_bytes(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main():
+    print(f"{'slots':>8} {'objects B/elem':>15} {'store B/elem':>13} {'objects relayout':>17} {'store relayout':>15}")
+    for total in SIZES:
+        # Values past the small-int cache, as in a real level
+        values = list(range(1000, 1000 + total))
+        spacing = slot_spacing(total, POT_MIN_SPACING, SCREEN_WIDTH)
+        (_, objects), objects_bytes = traced_bytes(lambda: build_objects(values, spacing))
+        store, store_bytes = traced_bytes(lambda: build_store(values, spacing))
+        assert [pot.x for pot in objects] == list(store.x)
+
+        repeat = max(1, 100_000 // total)
+        per_objects = timeit.timeit(lambda: [obj.relayout(spacing) for obj in objects], number=repeat) / repeat
+        per_store = timeit.timeit(lambda: store.relayout(spacing), number=repeat) / repeat
+        print(f"{total:>8} {objects_bytes / total:>15.1f} {store_bytes / total:>13.1f} "
+              f"{per_objects * 1000:>14.2f} ms {per_store * 1000:>12.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
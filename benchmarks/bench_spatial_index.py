@@ -0,0 +1,55 @@
+"""Micro-benchmark: SlotStore.nearest against a linear scan over every pot.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spatial_index
+"""
+import math
+import random
+import timeit
+
+from camera import slot_spacing
+from gnome_sorter_game import FlowerPot, GNOME_RADIUS, POT_MIN_SPACING, POT_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+from slot_store import SlotStore
+
+SIZES = (10, 1_000, 100_000)
+QUERIES = 200
+
+
+def nearest_brute_force(items, x, y, radius):
+    """Linear-scan reference: the closest item with .x/.y within radius, or None."""
+    best, best_dist = None, radius
+    for item in items:
+        dist = math.hypot(x - item.x, y - item.y)
+        if dist < best_dist:
+            best, best_dist = item, dist
+    return best
+
+
+def build_row(total):
+    store = SlotStore(FlowerPot, range(total), slot_spacing(total, POT_MIN_SPACING, SCREEN_WIDTH), int(SCREEN_HEIGHT / 2))
+    return list(store), store
+
+
+def main():
+    rng = random.Random(0)
+    radius = POT_RADIUS + GNOME_RADIUS
+    print(f"{'pots':>8} {'brute force':>14} {'slot store':>14} {'speedup':>9}")
+    for total in SIZES:
+        pots, store = build_row(total)
+        world_width = pots[-1].x + pots[0].x
+        points = [(rng.uniform(0, world_width), SCREEN_HEIGHT / 2 + rng.uniform(-60, 60)) for _ in range(QUERIES)]
+
+        for x, y in points:
+            expected = nearest_brute_force(pots, x, y, radius)
+            assert store.nearest(x, y, radius) == expected
+
+        repeat = max(1, 20_000 // total)
+        brute = timeit.timeit(lambda: [nearest_brute_force(pots, x, y, radius) for x, y in points], number=repeat)
+        row = timeit.timeit(lambda: [store.nearest(x, y, radius) for x, y in points], number=repeat)
+        per_brute, per_row = (t / (repeat * QUERIES) * 1e6 for t in (brute, row))
+        print(f"{total:>8} {per_brute:>11.2f} us {per_row:>11.2f} us {per_brute / per_row:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
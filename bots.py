@@ -0,0 +1,62 @@
+from simulation import IDLE_INPUT, InputState
+
+# --- Bot Players ---
+# Policies for Simulator(policy=...): each takes the game and returns the
+# InputState for the next tick. They play the same way a person following
+# the objective text would, which makes them useful for benchmarks and for
+# measuring how long a level takes.
+
+PRESS_SPACE = InputState(space=True)
+
+
+def steer_towards(actor, target_x, target_y, tolerance):
+    """Holds the direction keys that walk actor in a straight line to the target."""
+    dx = target_x - actor.x
+    dy = target_y - actor.y
+    return InputState(left=dx < -tolerance, right=dx > tolerance, up=dy < -tolerance, down=dy > tolerance)
+
+
+def steer_axis_first(actor, target_x, target_y, tolerance):
+    """Lines up horizontally first, then walks straight up or down to the target."""
+    dx = target_x - actor.x
+    if abs(dx) > tolerance:
+        return InputState(left=dx < 0, right=dx > 0)
+    dy = target_y - actor.y
+    return InputState(up=dy < -tolerance, down=dy > tolerance)
+
+
+def gnome_sort_policy(steer=steer_towards):
+    """A gnome sort bot that walks to the highlighted pot and confirms every prompt."""
+    def policy(game):
+        if game.state in ("READY", "SWAP_PROMPT", "ADVANCE_PROMPT"):
+            return PRESS_SPACE
+        if game.state == "MOVING_TO_COMPARE":
+            pot = game.pots[game.sort_index]
+            return steer(game.gnome, pot.x, pot.y, tolerance=2)
+        return IDLE_INPUT
+    return policy
+
+
+def selection_sort_policy(steer=steer_towards):
+    """A selection sort bot that carries each pass's minimum block to the swap target."""
+    def policy(game):
+        if game.state == "READY":
+            return PRESS_SPACE
+        if game.state == "MOVE_TO_MIN":
+            block = game.blocks[game.min_element_index]
+        elif game.state == "CARRYING_TO_SWAP":
+            block = game.blocks[game.current_pass_index]
+        else:
+            return IDLE_INPUT
+        return steer(game.sorter, block.x, block.y, tolerance=2.5)
+    return policy
+
+
+gnome_sort_bot = gnome_sort_policy()
+selection_sort_bot = selection_sort_policy()
+
+# Policies by game and name, for tools that pick one from the command line.
+POLICIES = {
+    "gnome": {"straight": gnome_sort_bot, "axis": gnome_sort_policy(steer_axis_first)},
+    "selection": {"straight": selection_sort_bot, "axis": selection_sort_policy(steer_axis_first)},
+}
@@ -0,0 +1,120 @@
+import math
+
+# --- World Layout & Camera ---
+# Small arrays are spread across the screen exactly as before. Once the
+# slots would get narrower than an element, they keep a fixed spacing
+# instead and the row becomes a world wider than the screen, viewed through
+# a camera that follows the player. Only the slots inside the view are
+# drawn, and once zoomed out past the point where full sprites would
+# overlap they are drawn as plain bars.
+
+MAX_ARRAY_SIZE = 100_000
+MAX_ZOOM = 1.0
+BAR_MAX_HEIGHT = 120
+LABEL_GAP = 10 # Clear space between neighbouring value labels
+
+
+def slot_spacing(total, min_spacing, screen_width):
+    """Distance between neighbouring array slots in world pixels."""
+    return max(screen_width / (total + 1), min_spacing)
+
+
+def value_range(total):
+    """The range random values are drawn from for an array of this size."""
+    return range(10, max(100, 10 + 10 * total))
+
+
+def label_width(total, digit_width):
+    """Upper bound on the width of any value label in an array of this size.
+
+    Counted in digits, with digit_width the widest digit of the label font,
+    rather than measured with the font, so game layouts stay the same when
+    run headless.
+    """
+    return len(str(value_range(total)[-1])) * digit_width
+
+
+LAYOUTS = ("random", "sorted", "reversed", "nearly_sorted")
+
+
+def initial_array(rng, total, layout="random"):
+    """Draws `total` distinct values from value_range(total), ordered by layout."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"unknown layout {layout!r}, expected one of {', '.join(LAYOUTS)}")
+    array = rng.sample(value_range(total), total)
+    if layout == "random":
+        return array
+    array.sort(reverse=layout == "reversed")
+    if layout == "nearly_sorted":
+        # A few adjacent swaps, so roughly one value in ten is out of place
+        for _ in range(max(1, total // 10)):
+            i = rng.randrange(total - 1)
+            array[i], array[i + 1] = array[i + 1], array[i]
+    return array
+
+
+class Camera:
+    """Horizontal scrolling and zoom over a row of evenly spaced slots.
+
+    `detail_spacing` is the on-screen slot width an element needs to be
+    drawn in full, without overlapping its neighbours or their labels.
+    """
+    def __init__(self, screen_width, world_width, spacing, detail_spacing):
+        self.screen_width = screen_width
+        self.zoom = MAX_ZOOM
+        self.left = 0.0
+        self.set_world(world_width, spacing, detail_spacing)
+
+    def set_world(self, world_width, spacing, detail_spacing):
+        """Updates the world size, e.g. after a reset with a new array."""
+        self.world_width = world_width
+        self.spacing = spacing
+        self.detail_spacing = detail_spacing
+        self.zoom = min(max(self.zoom, self.min_zoom), MAX_ZOOM)
+        self.left = 0.0
+
+    @property
+    def min_zoom(self):
+        # Never squeeze more than one slot into a pixel, and never zoom out
+        # further than it takes to see the whole world.
+        return min(MAX_ZOOM, max(self.screen_width / self.world_width, 1 / self.spacing))
+
+    @property
+    def view_width(self):
+        """Width of the visible part of the world, in world pixels."""
+        return self.screen_width / self.zoom
+
+    @property
+    def detailed(self):
+        """True when slots are wide enough on screen for full sprites."""
+        return self.spacing * self.zoom >= self.detail_spacing
+
+    def zoom_by(self, factor):
+        self.zoom = min(max(self.zoom * factor, self.min_zoom), MAX_ZOOM)
+
+    def follow(self, world_x):
+        """Centers the view on world_x without scrolling past either end."""
+        max_left = max(0.0, self.world_width - self.view_width)
+        self.left = min(max(world_x - self.view_width / 2, 0.0), max_left)
+
+    def to_screen_x(self, world_x):
+        return int((world_x - self.left) * self.zoom)
+
+    def visible_slots(self, total, margin=1):
+        """Range of slot indices that can appear on screen."""
+        first = math.floor(self.left / self.spacing) - 1 - margin
+        last = math.ceil((self.left + self.view_width) / self.spacing) + margin
+        return range(max(0, first), min(total, last))
+
+    def bar_rect(self, world_x, base_y, value, max_value):
+        """Screen rect of the level-of-detail bar for a slot holding value."""
+        width = max(1, int(self.spacing * self.zoom) - 1)
+        height = max(2, int(BAR_MAX_HEIGHT * value / max_value))
+        left = self.to_screen_x(world_x) - width // 2
+        return (left, base_y - height, width, height)
+
+
+def window_around(center, width, total):
+    """Range of at most width indices around center, clamped to [0, total)."""
+    start = min(max(0, center - width // 2), max(0, total - width))
+    return range(start, min(total, start + width))
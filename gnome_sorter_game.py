@@ -2,11 +2,33 @@ import pygame
 import random
 import sys
 import math
+import argparse
+import time
+from simulation import FixedStepDriver, lerp, read_input
+from surface_cache import overlay_cache, text_cache
+from renderer import SceneRenderer
+from slot_store import SlotHandle, SlotStore
+from scheduler import Scheduler
+from profiler import FrameProfiler, StartupProfile, TraceWriter
+from idle import FrameGovernor
+from startup import FontLoader, init_subsystems
+from replay import MAX_SEED, InputLog, InputRecorder, verify
+from array_strip import ArrayStrip
+from camera import LABEL_GAP, MAX_ARRAY_SIZE, Camera, initial_array, label_width, slot_spacing, value_range
+from sort_ops import AutoPlayer, gnome_sort_ops
 
 # --- Game Configuration ---
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 700
-FPS = 60
+FPS = 60 # Default render rate cap
+TICK_RATE = 60 # Simulation steps per second, independent of the render rate
+TICK_MS = 1000 / TICK_RATE # Simulated time per game step
+TITLE_FONT_SIZE = 50
+TEXT_FONT_SIZE = 32
+POT_FONT_SIZE = 40
+OVERLAY_FONT_SIZE = 22 # Only loaded once the F3 overlay is first shown
+GAME_NAME = "gnome" # Identifies this game's input logs
+AUTO_BUDGET_MS = 8.0 # Default --auto time per frame spent sorting, about half a 60 FPS frame
 
 # --- Colors ---
 COLOR_BACKGROUND = (26, 77, 46)  # Dark Green
@@ -22,199 +44,458 @@ COLOR_GNOME_BODY = (0, 0, 255)     # Blue
 POT_RADIUS = 35
 GNOME_RADIUS = 20
 GNOME_SPEED = 4
+POT_MIN_SPACING = 90 # Closest two pots may be before the row scrolls
+POT_DIGIT_WIDTH = 18 # Widest digit of a pot label at POT_FONT_SIZE, rounded up
+SWAP_SLIDE_MS = 250 # How long swapped pots take to slide into place
 
 class Gnome:
     """Represents the player character, the gnome."""
-    def __init__(self, x, y):
+    def __init__(self, x, y, world_width=SCREEN_WIDTH):
         self.x = x
         self.y = y
+        self.prev_x, self.prev_y = x, y # Position before the last step, for interpolation
+        self.world_width = world_width
 
-    def move(self):
-        """Updates the gnome's position based on keyboard input."""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+    def move(self, inputs):
+        """Updates the gnome's position based on the held direction keys."""
+        if inputs.left:
             self.x -= GNOME_SPEED
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if inputs.right:
             self.x += GNOME_SPEED
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if inputs.up:
             self.y -= GNOME_SPEED
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if inputs.down:
             self.y += GNOME_SPEED
 
-        # Keep gnome within the screen bounds
-        self.x = max(GNOME_RADIUS, min(self.x, SCREEN_WIDTH - GNOME_RADIUS))
+        # Keep gnome within the garden
+        self.x = max(GNOME_RADIUS, min(self.x, self.world_width - GNOME_RADIUS))
         self.y = max(GNOME_RADIUS, min(self.y, SCREEN_HEIGHT - GNOME_RADIUS))
 
-    def draw(self, screen):
-        """Draws the gnome on the screen."""
+    def draw(self, screen, screen_pos=None):
+        """Draws the gnome on the screen, at screen_pos if given."""
+        x, y = (self.x, self.y) if screen_pos is None else screen_pos
         # Body
-        pygame.draw.circle(screen, COLOR_GNOME_BODY, (self.x, self.y + 5), GNOME_RADIUS)
+        pygame.draw.circle(screen, COLOR_GNOME_BODY, (x, y + 5), GNOME_RADIUS)
         # Hat
-        hat_points = [(self.x, self.y - 30), (self.x - 20, self.y), (self.x + 20, self.y)]
+        hat_points = [(x, y - 30), (x - 20, y), (x + 20, y)]
         pygame.draw.polygon(screen, COLOR_GNOME_HAT, hat_points)
-        pygame.draw.circle(screen, (255, 255, 255), (self.x, self.y - 30), 5) # Hat bobble
+        pygame.draw.circle(screen, (255, 255, 255), (x, y - 30), 5) # Hat bobble
+
+    def get_rect(self, screen_pos=None):
+        """Returns the screen area covered by draw()."""
+        x, y = (self.x, self.y) if screen_pos is None else screen_pos
+        return pygame.Rect(int(x) - GNOME_RADIUS - 1, int(y) - 36, GNOME_RADIUS * 2 + 2, 62)
 
     def is_colliding_with(self, pot):
         """Checks if the gnome is close enough to a pot to interact."""
         dist = math.hypot(self.x - pot.x, self.y - pot.y)
         return dist < POT_RADIUS + GNOME_RADIUS
 
-class FlowerPot:
-    """Represents a single flower pot to be sorted."""
-    def __init__(self, value, pos_index, total_pots):
-        self.value = value
-        self.pos_index = pos_index
-        self.update_screen_pos(total_pots)
-
-    def update_screen_pos(self, total_pots):
-        """Calculates the x, y coordinates on the screen based on array position."""
-        spacing = SCREEN_WIDTH / (total_pots + 1)
-        self.x = int(spacing * (self.pos_index + 1))
-        self.y = int(SCREEN_HEIGHT / 2)
-
-    def draw(self, screen, font, is_current=False, is_compare=False):
-        """Draws the flower pot and its value."""
+class FlowerPot(SlotHandle):
+    """Represents a single flower pot to be sorted.
+
+    A handle onto one slot of the game's pot row (a SlotStore), which holds
+    the value, position and drawing offset.
+    """
+    __slots__ = ()
+
+    def get_rect(self, font, screen_x=None):
+        """Returns the screen area covered by draw(), including the value text."""
+        x = self.x + self.offset_x if screen_x is None else screen_x
+        rect = pygame.Rect(x - POT_RADIUS, self.y - POT_RADIUS, POT_RADIUS * 2, POT_RADIUS * 2)
+        text_surf = text_cache.render(font, str(self.value), True, COLOR_TEXT)
+        return rect.union(text_surf.get_rect(center=(x, self.y + 5)))
+
+    def draw(self, screen, font, is_current=False, is_compare=False, screen_x=None):
+        """Draws the flower pot and its value, at screen_x if the view is scrolled."""
+        x = self.x + self.offset_x if screen_x is None else screen_x
         # Draw highlights if necessary
         if is_current or is_compare:
-            highlight_surface = pygame.Surface((POT_RADIUS * 2, POT_RADIUS * 2), pygame.SRCALPHA)
             color = COLOR_HIGHLIGHT_CURRENT if is_current else COLOR_HIGHLIGHT_COMPARE
-            pygame.draw.circle(highlight_surface, color, (POT_RADIUS, POT_RADIUS), POT_RADIUS)
-            screen.blit(highlight_surface, (self.x - POT_RADIUS, self.y - POT_RADIUS))
+            highlight_surface = overlay_cache.circle(POT_RADIUS, color)
+            screen.blit(highlight_surface, (x - POT_RADIUS, self.y - POT_RADIUS))
         
         # Pot Body
-        pygame.draw.rect(screen, COLOR_POT_BODY, (self.x - 25, self.y - 15, 50, 40))
+        pygame.draw.rect(screen, COLOR_POT_BODY, (x - 25, self.y - 15, 50, 40))
         # Pot Rim
-        pygame.draw.rect(screen, COLOR_POT_RIM, (self.x - 30, self.y - 25, 60, 10))
+        pygame.draw.rect(screen, COLOR_POT_RIM, (x - 30, self.y - 25, 60, 10))
         
         # Value Text
-        text_surf = font.render(str(self.value), True, COLOR_TEXT)
-        text_rect = text_surf.get_rect(center=(self.x, self.y + 5))
+        text_surf = text_cache.render(font, str(self.value), True, COLOR_TEXT)
+        text_rect = text_surf.get_rect(center=(x, self.y + 5))
         screen.blit(text_surf, text_rect)
 
+def draw_pot_bar(screen, rect, is_current=False, is_compare=False):
+    """Draws a pot as a plain bar, the zoomed-out level of detail."""
+    if is_current:
+        color = COLOR_HIGHLIGHT_CURRENT[:3]
+    elif is_compare:
+        color = COLOR_HIGHLIGHT_COMPARE[:3]
+    else:
+        color = COLOR_POT_RIM
+    pygame.draw.rect(screen, color, rect)
+
+# Screen areas covered by the top and bottom halves of the HUD
+HUD_HEADER_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 165)
+HUD_FOOTER_RECT = pygame.Rect(0, SCREEN_HEIGHT - 85, SCREEN_WIDTH, 85)
+hud_strip = ArrayStrip((20, SCREEN_HEIGHT - 80), SCREEN_WIDTH - 40, COLOR_TEXT, "Array:")
+# Sprites kept in the renderer's background layer, which is rebuilt only when one changes
+STATIC_SPRITES = ("hud_header",) # Title and objective panel
+
 def draw_hud(screen, title_font, text_font, objective, array, index, game_state):
     """Draws all the UI text elements."""
+    draw_hud_header(screen, title_font, text_font, objective)
+    draw_hud_footer(screen, text_font, array, index, game_state)
+
+def draw_hud_header(screen, title_font, text_font, objective):
+    """Draws the title and the objective panel."""
     # Title
-    title_surf = title_font.render("Gnome Sorter: The Garden Gauntlet", True, COLOR_TEXT)
+    title_surf = text_cache.render(title_font, "Gnome Sorter: The Garden Gauntlet", True, COLOR_TEXT)
     screen.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
 
     # Objective Panel
     pygame.draw.rect(screen, (0,0,0,150), [20, 80, SCREEN_WIDTH - 40, 80], border_radius=10)
-    obj_title = text_font.render("Current Objective:", True, (255, 255, 0))
+    obj_title = text_cache.render(text_font, "Current Objective:", True, (255, 255, 0))
     screen.blit(obj_title, (40, 90))
-    obj_text = text_font.render(objective, True, COLOR_TEXT)
+    obj_text = text_cache.render(text_font, objective, True, COLOR_TEXT)
     screen.blit(obj_text, (40, 120))
 
-    # Array Display
-    array_str = ' '.join([f"[{val}]" if i == index or i == index-1 else str(val) for i, val in enumerate(array)])
-    arr_surf = text_font.render(f"Array: {array_str}", True, COLOR_TEXT)
-    screen.blit(arr_surf, (20, SCREEN_HEIGHT - 80))
+def draw_hud_footer(screen, text_font, array, index, game_state):
+    """Draws the array and algorithm state lines."""
+    # Array Display, scrolled to keep the compared pair in view
+    hud_strip.draw(screen, text_font, array, index, marked=(index - 1, index))
 
     # Game State Display
-    state_surf = text_font.render(f"Algorithm State: {game_state}", True, COLOR_TEXT)
+    state_surf = text_cache.render(text_font, f"Algorithm State: {game_state}", True, COLOR_TEXT)
     screen.blit(state_surf, (20, SCREEN_HEIGHT - 50))
 
-def main():
-    """Main function to run the game."""
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Gnome Sorter Game")
-    clock = pygame.time.Clock()
+class GnomeSortGame:
+    """The gnome sort state machine, advanced one tick at a time.
 
-    # --- Fonts ---
-    title_font = pygame.font.Font(None, 50)
-    text_font = pygame.font.Font(None, 32)
-    pot_font = pygame.font.Font(None, 40)
-
-    # --- Game Variables ---
-    game_data = {
-        "state": "READY",
-        "objective": "Press SPACE to start sorting the flower pots!",
-        "array_to_sort": [],
-        "pots": [],
-        "sort_index": 0
-    }
-    gnome = Gnome(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
-
-    def reset_game():
+    Holds no references to the display or clock, so it can be stepped
+    headlessly by a Simulator as well as by main(). Animations run on
+    `scheduler`, which advances by TICK_MS of simulated time per step.
+    """
+    def __init__(self, seed=None, size=8, layout="random"):
+        if not 2 <= size <= MAX_ARRAY_SIZE:
+            raise ValueError(f"array size must be between 2 and {MAX_ARRAY_SIZE}, got {size}")
+        self.rng = random.Random(seed)
+        self.size = size
+        self.layout = layout
+        self.gnome = Gnome(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
+        self.scheduler = Scheduler()
+        self.ticks = 0
+        self.generation = 0 # Bumped on every reset
+        self.reset()
+
+    @property
+    def finished(self):
+        return self.state == "FINISHED"
+
+    def is_idle(self, inputs):
+        """True when a tick with these held keys would change nothing on screen."""
+        held = inputs.left or inputs.right or inputs.up or inputs.down
+        moving = held and self.state not in ["READY", "FINISHED"]
+        gnome = self.gnome
+        at_rest = (gnome.x, gnome.y) == (gnome.prev_x, gnome.prev_y)
+        return not moving and at_rest and not self.scheduler.busy
+
+    def reset(self):
         """Resets the game to its initial state."""
-        nonlocal game_data
-        game_data["state"] = "READY"
-        game_data["objective"] = "Press SPACE to start sorting! (R to reset)"
-        
+        self.generation += 1
+        self.scheduler.clear()
+        self.state = "READY"
+        self.objective = "Press SPACE to start sorting! (R to reset)"
+
         # Generate a new random array
-        game_data["array_to_sort"] = random.sample(range(10, 100), 8)
-        game_data["pots"] = [FlowerPot(val, i, len(game_data["array_to_sort"])) for i, val in enumerate(game_data["array_to_sort"])]
-        game_data["sort_index"] = 1 # Gnome sort starts by comparing index 1 and 0
+        values = value_range(self.size)
+        self.max_value = values[-1]
+        # Pots (and their highlights) are drawn in full only while they and
+        # their labels fit in a slot; long labels also push the pots apart
+        self.detail_spacing = max(POT_RADIUS * 2, label_width(self.size, POT_DIGIT_WIDTH) + LABEL_GAP)
+        self.spacing = slot_spacing(self.size, max(POT_MIN_SPACING, self.detail_spacing), SCREEN_WIDTH)
+        self.pots = SlotStore(FlowerPot, initial_array(self.rng, self.size, self.layout),
+                              self.spacing, int(SCREEN_HEIGHT / 2))
+        self.array_to_sort = self.pots.value # Swapping here swaps the pots too
+        self.world_width = int(self.spacing * (self.size + 1))
+        self.gnome.world_width = self.world_width
+        self.sort_index = 1 # Gnome sort starts by comparing index 1 and 0
 
-    # Initialize game for the first time
-    reset_game()
+    def pot_at_gnome(self):
+        """Returns the pot the gnome is close enough to interact with, if any."""
+        return self.pots.nearest(self.gnome.x, self.gnome.y, POT_RADIUS + GNOME_RADIUS)
+
+    def step(self, inputs):
+        """Advances the game by one tick using the given InputState."""
+        self.ticks += 1
+        self.scheduler.update(TICK_MS)
+        self.gnome.prev_x, self.gnome.prev_y = self.gnome.x, self.gnome.y
+
+        # --- Input ---
+        if inputs.reset:
+            self.reset()
+        if inputs.space:
+            if self.state == "READY":
+                self.state = "MOVING_TO_COMPARE"
+            elif self.state == "SWAP_PROMPT":
+                # Perform the swap
+                i = self.sort_index
+                self.array_to_sort[i], self.array_to_sort[i - 1] = self.array_to_sort[i - 1], self.array_to_sort[i]
+                # Let the two pots slide past each other into their new slots
+                left, right = self.pots[i - 1], self.pots[i]
+                self.scheduler.tween(right, "offset_x", left.x - right.x, 0.0, SWAP_SLIDE_MS)
+                self.scheduler.tween(left, "offset_x", right.x - left.x, 0.0, SWAP_SLIDE_MS)
+
+                # Move index back
+                self.sort_index = max(1, self.sort_index - 1)
+                self.state = "MOVING_TO_COMPARE"
+            elif self.state == "ADVANCE_PROMPT":
+                # Move index forward
+                self.sort_index += 1
+                if self.sort_index >= len(self.array_to_sort):
+                    self.state = "FINISHED"
+                else:
+                    self.state = "MOVING_TO_COMPARE"
+            elif self.state == "FINISHED":
+                self.reset()
 
-    # --- Main Game Loop ---
-    running = True
-    while running:
-        # --- Event Handling ---
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    reset_game()
-                if event.key == pygame.K_SPACE:
-                    if game_data["state"] == "READY":
-                        game_data["state"] = "MOVING_TO_COMPARE"
-                    elif game_data["state"] == "SWAP_PROMPT":
-                        # Perform the swap
-                        game_data["array_to_sort"][game_data["sort_index"]], game_data["array_to_sort"][game_data["sort_index"] - 1] = game_data["array_to_sort"][game_data["sort_index"] - 1], game_data["array_to_sort"][game_data["sort_index"]]
-                        game_data["pots"][game_data["sort_index"]].value, game_data["pots"][game_data["sort_index"]-1].value = game_data["pots"][game_data["sort_index"]-1].value, game_data["pots"][game_data["sort_index"]].value
-                        
-                        # Move index back
-                        game_data["sort_index"] = max(1, game_data["sort_index"] - 1)
-                        game_data["state"] = "MOVING_TO_COMPARE"
-                    elif game_data["state"] == "ADVANCE_PROMPT":
-                        # Move index forward
-                        game_data["sort_index"] += 1
-                        if game_data["sort_index"] >= len(game_data["array_to_sort"]):
-                            game_data["state"] = "FINISHED"
-                        else:
-                            game_data["state"] = "MOVING_TO_COMPARE"
-                    elif game_data["state"] == "FINISHED":
-                         reset_game()
-        
         # --- Game Logic (State Machine) ---
-        if game_data["state"] == "MOVING_TO_COMPARE":
-            game_data["objective"] = f"Move the gnome to pot {game_data['sort_index']} to compare it with the previous one."
-            target_pot = game_data["pots"][game_data["sort_index"]]
-            if gnome.is_colliding_with(target_pot):
+        if self.state == "MOVING_TO_COMPARE":
+            i = self.sort_index
+            self.objective = f"Move the gnome to pot {i} to compare it with the previous one."
+            standing_at = self.pot_at_gnome()
+            if standing_at is not None and standing_at.index != i:
+                self.objective = f"That's pot {standing_at.index}. Move the gnome to pot {i} to compare it with the previous one."
+            if self.gnome.is_colliding_with(self.pots[i]):
                 # Comparison logic of Gnome Sort
-                if game_data["array_to_sort"][game_data["sort_index"]] < game_data["array_to_sort"][game_data["sort_index"] - 1]:
-                    game_data["objective"] = f"{game_data['array_to_sort'][game_data['sort_index']]} < {game_data['array_to_sort'][game_data['sort_index']-1]}. Out of order! Press SPACE to SWAP."
-                    game_data["state"] = "SWAP_PROMPT"
+                if self.array_to_sort[i] < self.array_to_sort[i - 1]:
+                    self.objective = f"{self.array_to_sort[i]} < {self.array_to_sort[i-1]}. Out of order! Press SPACE to SWAP."
+                    self.state = "SWAP_PROMPT"
                 else:
-                    game_data["objective"] = f"{game_data['array_to_sort'][game_data['sort_index']]} >= {game_data['array_to_sort'][game_data['sort_index']-1]}. In order! Press SPACE to ADVANCE."
-                    game_data["state"] = "ADVANCE_PROMPT"
-        
-        elif game_data["state"] == "FINISHED":
-            game_data["objective"] = "All pots sorted! Press SPACE to play again."
+                    self.objective = f"{self.array_to_sort[i]} >= {self.array_to_sort[i-1]}. In order! Press SPACE to ADVANCE."
+                    self.state = "ADVANCE_PROMPT"
+
+        elif self.state == "FINISHED":
+            self.objective = "All pots sorted! Press SPACE to play again."
 
         # --- Update ---
-        if game_data["state"] not in ["READY", "FINISHED"]:
-            gnome.move()
+        if self.state not in ["READY", "FINISHED"]:
+            self.gnome.move(inputs)
 
-        # --- Drawing ---
-        screen.fill(COLOR_BACKGROUND)
-        
-        # Draw pots with appropriate highlights
-        for i, pot in enumerate(game_data["pots"]):
-            is_current = (game_data["state"] != "READY" and i == game_data["sort_index"])
-            is_compare = (game_data["state"] != "READY" and i == game_data["sort_index"] - 1)
-            pot.draw(screen, pot_font, is_current, is_compare)
+    # --- Auto-Play ---
+    def auto_ops(self):
+        """The rest of the sort as a lazy stream of compare and swap operations."""
+        return gnome_sort_ops(self.array_to_sort)
+
+    def show_auto(self, player):
+        """Shows an AutoPlayer's progress: the gnome stands at the pot last compared."""
+        self.objective = player.status
+        if player.finished:
+            self.state = "FINISHED"
+            self.sort_index = len(self.array_to_sort)
+            return
+        self.state = "AUTO_PLAY"
+        if player.last_op is not None:
+            self.sort_index = player.last_op[2]
+        self.gnome.x = self.gnome.prev_x = self.pots.x[self.sort_index]
+        self.gnome.prev_y = self.gnome.y
+
+def build_scene(game, camera, title_font, text_font, pot_font, alpha=1.0):
+    """Describes the frame as a back-to-front sprite list for SceneRenderer.
+
+    Only pots inside the camera view are included. The gnome is drawn
+    `alpha` of the way from its previous to its current simulated position.
+    """
+    sprites = []
+    active = game.state != "READY"
+    base_y = int(SCREEN_HEIGHT / 2) + 25
+
+    # Pots with appropriate highlights, read straight from the row's arrays;
+    # a handle is only made for pots drawn in full
+    pots = game.pots
+    xs, values, offsets = pots.x, pots.value, pots.offsets
+    detailed = camera.detailed
+    for i in camera.visible_slots(len(pots)):
+        is_current = (active and i == game.sort_index)
+        is_compare = (active and i == game.sort_index - 1)
+        world_x = xs[i] + offsets.get(i, 0.0)
+        if detailed:
+            pot = pots[i]
+            x = camera.to_screen_x(world_x)
+            sprites.append((("pot", i), pot.get_rect(pot_font, x), (x, pots.y, values[i], is_current, is_compare),
+                            pot.draw, (pot_font, is_current, is_compare, x)))
+        else:
+            rect = camera.bar_rect(world_x, base_y, values[i], game.max_value)
+            sprites.append((("pot", i), rect, (rect, is_current, is_compare),
+                            draw_pot_bar, (rect, is_current, is_compare)))
+
+    gnome = game.gnome
+    gnome_pos = (camera.to_screen_x(lerp(gnome.prev_x, gnome.x, alpha)), int(lerp(gnome.prev_y, gnome.y, alpha)))
+    sprites.append(("gnome", gnome.get_rect(gnome_pos), gnome_pos, gnome.draw, (gnome_pos,)))
+    sprites.append(("hud_header", HUD_HEADER_RECT, game.objective,
+                    draw_hud_header, (title_font, text_font, game.objective)))
+    shown = hud_strip.window(text_font, len(game.array_to_sort), game.sort_index)
+    sprites.append(("hud_footer", HUD_FOOTER_RECT, (tuple(game.array_to_sort[shown.start:shown.stop]), game.sort_index, game.state),
+                    draw_hud_footer, (text_font, game.array_to_sort, game.sort_index, game.state)))
+    return sprites
+
+def main(argv=None):
+    """Main function to run the game."""
+    startup = StartupProfile()
+    parser = argparse.ArgumentParser(description="Gnome Sorter: The Garden Gauntlet")
+    parser.add_argument("--size", type=int, default=8,
+                        help=f"number of flower pots to sort (2-{MAX_ARRAY_SIZE})")
+    parser.add_argument("--max-fps", type=int, default=FPS,
+                        help=f"cap on rendered frames per second, 0 for uncapped; the game always simulates {TICK_RATE} ticks/s")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only repaint and push the screen regions that changed each frame")
+    parser.add_argument("--trace", metavar="OUT.json",
+                        help="stream per-frame phase timings to a Chrome trace file (F3 toggles the on-screen overlay)")
+    parser.add_argument("--no-idle", action="store_true",
+                        help="keep redrawing at full rate even while nothing on screen can change")
+    parser.add_argument("--cpu-report", action="store_true", help="print CPU use of idle and active frames on exit")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print the time to the first frame, broken down by startup phase")
+    parser.add_argument("--seed", type=int, help="seed for the shuffled array (random by default)")
+    parser.add_argument("--record", metavar="LOG", help="write the seed and every tick's input to a replayable log")
+    parser.add_argument("--replay", metavar="LOG", help="play back a log written with --record at normal speed")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay, run the log as fast as possible without a window and check its result")
+    parser.add_argument("--auto", nargs="?", const=1, type=int, metavar="OPS",
+                        help="watch the sort play itself, OPS compares and swaps per frame (default 1; [ and ] halve and double it)")
+    parser.add_argument("--auto-budget-ms", type=float, default=AUTO_BUDGET_MS,
+                        help=f"with --auto, most time per frame spent sorting (default {AUTO_BUDGET_MS:g})")
+    args = parser.parse_args(argv)
+    if not 2 <= args.size <= MAX_ARRAY_SIZE:
+        parser.error(f"--size must be between 2 and {MAX_ARRAY_SIZE}")
+    if args.seed is not None and not 0 <= args.seed <= MAX_SEED:
+        parser.error(f"--seed must be between 0 and {MAX_SEED}")
+    if args.record and args.replay:
+        parser.error("--record and --replay can't be combined")
+    if args.headless and not args.replay:
+        parser.error("--headless needs --replay")
+    if args.auto is not None and (args.record or args.replay):
+        parser.error("--auto can't be combined with --record or --replay")
+    if args.auto is not None and args.auto < 1:
+        parser.error("--auto needs at least 1 operation per frame")
+
+    log = None
+    if args.replay:
+        try:
+            log = InputLog.load(args.replay)
+            log.check_compatible(GAME_NAME, TICK_RATE)
+        except (OSError, ValueError) as e:
+            parser.error(f"can't replay {args.replay}: {e}")
+        if args.headless:
+            ok, description = verify(log)
+            print(description)
+            sys.exit(0 if ok else 1)
+    seed = log.seed if log else args.seed if args.seed is not None else random.randrange(2 ** 32)
+    size = log.size if log else args.size
 
-        gnome.draw(screen)
-        draw_hud(screen, title_font, text_font, game_data["objective"], game_data["array_to_sort"], game_data["sort_index"], game_data["state"])
+    with startup.phase("init"):
+        init_subsystems()
+    # --- Fonts ---
+    # Loaded in the background while the window opens and the game is built
+    fonts = FontLoader((TITLE_FONT_SIZE, TEXT_FONT_SIZE, POT_FONT_SIZE))
+    with startup.phase("display"):
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Gnome Sorter Game")
+    clock = pygame.time.Clock()
+
+    with startup.phase("game"):
+        game = GnomeSortGame(seed=seed, size=size)
+    with startup.phase("fonts"):
+        title_font = fonts.get(TITLE_FONT_SIZE)
+        text_font = fonts.get(TEXT_FONT_SIZE)
+        pot_font = fonts.get(POT_FONT_SIZE)
+    camera = Camera(SCREEN_WIDTH, game.world_width, game.spacing, game.detail_spacing)
+    trace = TraceWriter(args.trace, "Gnome Sorter") if args.trace else None
+    profiler = FrameProfiler(trace=trace)
+    renderer = SceneRenderer(screen, COLOR_BACKGROUND, dirty_rects=args.dirty_rects, profiler=profiler,
+                             static_keys=STATIC_SPRITES)
+    recorder = InputRecorder(args.record, GAME_NAME, seed, size, TICK_RATE) if args.record else None
+    driver = FixedStepDriver(game, TICK_MS, script=log.inputs() if log else None, recorder=recorder)
+    # Replays feed input the window never sees, so they always run at full rate
+    governor = FrameGovernor(clock, args.max_fps, enabled=not args.no_idle and log is None)
+    autoplay = AutoPlayer(game, args.auto, args.auto_budget_ms) if args.auto is not None else None
+    generation = game.generation
+    last_frame = time.perf_counter()
+
+    # --- Main Game Loop ---
+    loop_start = time.perf_counter()
+    running = True
+    while running:
+        profiler.begin_frame()
+
+        # --- Event Handling ---
+        with profiler.phase("events"):
+            events = governor.events()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                    renderer.invalidate()
+                if event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                        camera.zoom_by(0.5)
+                    if event.key in (pygame.K_EQUALS, pygame.K_KP_PLUS):
+                        camera.zoom_by(2)
+                    if autoplay is not None and event.key == pygame.K_LEFTBRACKET:
+                        autoplay.scale_speed(0.5)
+                    if autoplay is not None and event.key == pygame.K_RIGHTBRACKET:
+                        autoplay.scale_speed(2)
+                    if event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                        renderer.invalidate()
+            inputs = read_input(events)
+
+        # --- Fixed-Timestep Update ---
+        with profiler.phase("update"):
+            now = time.perf_counter()
+            if autoplay is not None:
+                autoplay.handle(inputs)
+                autoplay.run_frame()
+            else:
+                driver.update((now - last_frame) * 1000, inputs)
+            last_frame = now
+            if game.generation != generation:
+                generation = game.generation
+                camera.set_world(game.world_width, game.spacing, game.detail_spacing)
+                renderer.invalidate()
+            camera.follow(lerp(game.gnome.prev_x, game.gnome.x, driver.alpha))
+
+        # --- Drawing ---
+        with profiler.phase("build_scene"):
+            sprites = build_scene(game, camera, title_font, text_font, pot_font, driver.alpha)
+            if profiler.overlay_visible:
+                sprites.append(profiler.overlay_sprite(SCREEN_WIDTH, fonts.get(OVERLAY_FONT_SIZE)))
+        renderer.render(sprites)
+        if startup is not None:
+            startup.add("first_frame", time.perf_counter() - loop_start)
+            startup.frame_presented()
+            if args.startup_profile:
+                print(startup.report())
+            startup = None
 
-        pygame.display.flip()
-        clock.tick(FPS)
+        with profiler.phase("wait"):
+            if autoplay is not None:
+                idle = autoplay.idle and not profiler.overlay_visible
+            else:
+                idle = game.is_idle(inputs) and not driver.pending_input and not profiler.overlay_visible
+            if governor.end_frame(idle):
+                # Whatever ended the wait gets a tick straight away, without
+                # catching up on the time spent asleep
+                last_frame = time.perf_counter() - TICK_MS / 1000
+        profiler.end_frame()
 
+    if trace is not None:
+        trace.close()
+    if args.cpu_report:
+        print(governor.meter.report())
+    if recorder is not None:
+        recorder.close(game)
+        print(f"Recorded {recorder.ticks} ticks (seed {seed}) to {args.record}")
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,80 @@
+import time
+
+import pygame
+
+# --- Idle Mode ---
+# Most of a session is spent looking at a prompt: nothing is animating, no
+# movement key is held, and every frame would be identical to the last.
+# Rather than redrawing at full rate regardless, the main loop asks the
+# game whether it is idle and, if so, sleeps in pygame.event.wait() until
+# input arrives (or a timeout passes), then goes straight back to full
+# frame rate for as long as anything is moving.
+
+IDLE_WAIT_MS = 250 # Longest block between frames while idle
+
+
+class CpuMeter:
+    """Process CPU time versus wall time, split into idle and active frames.
+
+    A frame counts as idle when nothing on screen could change, whether or
+    not the loop actually slept, so runs with idle mode on and off compare
+    like for like.
+    """
+    def __init__(self):
+        self.wall = {True: 0.0, False: 0.0}
+        self.cpu = {True: 0.0, False: 0.0}
+        self.frames = {True: 0, False: 0}
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def end_frame(self, idle):
+        wall, cpu = time.perf_counter(), time.process_time()
+        self.wall[idle] += wall - self._wall
+        self.cpu[idle] += cpu - self._cpu
+        self.frames[idle] += 1
+        self._wall, self._cpu = wall, cpu
+
+    def usage(self, idle):
+        """Fraction of one core used during idle (or active) frames."""
+        return self.cpu[idle] / self.wall[idle] if self.wall[idle] else 0.0
+
+    def report(self):
+        lines = []
+        for idle, name in ((True, "idle"), (False, "active")):
+            lines.append(f"{name:>6}: {self.wall[idle]:7.1f} s, {self.frames[idle]:6d} frames, "
+                         f"{self.usage(idle):6.1%} CPU")
+        return "\n".join(lines)
+
+
+class FrameGovernor:
+    """Ends each frame by pacing to the frame cap, or by sleeping while idle.
+
+    Events that wake an idle wait are handed back by the next events() call,
+    so nothing the game would have seen is lost.
+    """
+    def __init__(self, clock, max_fps, enabled=True, wait_ms=IDLE_WAIT_MS):
+        self.clock = clock
+        self.max_fps = max_fps
+        self.enabled = enabled
+        self.wait_ms = wait_ms
+        self.meter = CpuMeter()
+        self._pending = []
+
+    def events(self):
+        """This frame's events, including any that ended an idle wait."""
+        events = self._pending + pygame.event.get()
+        self._pending = []
+        return events
+
+    def end_frame(self, idle):
+        """Waits for the next frame; returns True if it slept waiting for input."""
+        slept = idle and self.enabled
+        if slept:
+            event = pygame.event.wait(self.wait_ms)
+            if event.type != pygame.NOEVENT:
+                self._pending.append(event)
+            self.clock.tick() # Keep the clock's frame timing in step
+        else:
+            self.clock.tick(self.max_fps)
+        self.meter.end_frame(idle)
+        return slept
@@ -2,11 +2,34 @@ import pygame
 import random
 import sys
 import math
+import argparse
+import time
+from simulation import FixedStepDriver, lerp, read_input
+from surface_cache import overlay_cache, text_cache
+from renderer import SceneRenderer
+from slot_store import SlotHandle, SlotStore
+from min_tree import MinSegmentTree
+from scheduler import Scheduler
+from profiler import FrameProfiler, StartupProfile, TraceWriter
+from idle import FrameGovernor
+from startup import FontLoader, init_subsystems
+from replay import MAX_SEED, InputLog, InputRecorder, verify
+from array_strip import ArrayStrip
+from camera import LABEL_GAP, MAX_ARRAY_SIZE, Camera, initial_array, label_width, slot_spacing, value_range
+from sort_ops import COMPARE, AutoPlayer, selection_sort_ops
 
 # --- Game Configuration ---
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 700
-FPS = 60
+FPS = 60 # Default render rate cap
+TICK_RATE = 60 # Simulation steps per second, independent of the render rate
+TICK_MS = 1000 / TICK_RATE # Simulated time per game step
+TITLE_FONT_SIZE = 50
+TEXT_FONT_SIZE = 32
+BLOCK_FONT_SIZE = 45
+OVERLAY_FONT_SIZE = 22 # Only loaded once the F3 overlay is first shown
+GAME_NAME = "selection" # Identifies this game's input logs
+AUTO_BUDGET_MS = 8.0 # Default --auto time per frame spent sorting, about half a 60 FPS frame
 
 # --- Colors ---
 COLOR_BACKGROUND = (17, 24, 39)      # Dark Blue/Gray
@@ -25,67 +48,84 @@ BLOCK_WIDTH = 80
 BLOCK_HEIGHT = 80
 SORTER_RADIUS = 25
 SORTER_SPEED = 4.5
+BLOCK_MIN_SPACING = 100 # Closest two blocks may be before the row scrolls
+BLOCK_DIGIT_WIDTH = 20 # Widest digit of a block label at BLOCK_FONT_SIZE, rounded up
+SWAP_PAUSE_MS = 1000 # How long a finished swap is shown before the next pass
+SWAP_SLIDE_MS = 600 # How long the displaced block takes to slide to its new slot
 
 class Sorter:
     """Represents the player-controlled Sorter."""
-    def __init__(self, x, y):
+    def __init__(self, x, y, world_width=SCREEN_WIDTH):
         self.x = x
         self.y = y
+        self.prev_x, self.prev_y = x, y # Position before the last step, for interpolation
+        self.world_width = world_width
         self.carrying_block_value = None
         self.is_carrying = False
 
-    def move(self):
-        """Updates the Sorter's position based on keyboard input."""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+    def move(self, inputs):
+        """Updates the Sorter's position based on the held direction keys."""
+        if inputs.left:
             self.x -= SORTER_SPEED
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if inputs.right:
             self.x += SORTER_SPEED
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if inputs.up:
             self.y -= SORTER_SPEED
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if inputs.down:
             self.y += SORTER_SPEED
 
-        # Keep Sorter within the screen bounds
-        self.x = max(SORTER_RADIUS, min(self.x, SCREEN_WIDTH - SORTER_RADIUS))
+        # Keep Sorter within the world bounds
+        self.x = max(SORTER_RADIUS, min(self.x, self.world_width - SORTER_RADIUS))
         self.y = max(SORTER_RADIUS, min(self.y, SCREEN_HEIGHT - SORTER_RADIUS))
 
-    def draw(self, screen, font):
-        """Draws the Sorter on the screen."""
-        pygame.draw.circle(screen, COLOR_SORTER_BODY, (self.x, self.y), SORTER_RADIUS)
-        pygame.draw.circle(screen, COLOR_SORTER_ACCENT, (self.x, self.y), SORTER_RADIUS, 3)
+    def draw(self, screen, font, screen_pos=None):
+        """Draws the Sorter on the screen, at screen_pos if given."""
+        x, y = (self.x, self.y) if screen_pos is None else screen_pos
+        pygame.draw.circle(screen, COLOR_SORTER_BODY, (x, y), SORTER_RADIUS)
+        pygame.draw.circle(screen, COLOR_SORTER_ACCENT, (x, y), SORTER_RADIUS, 3)
         # If carrying a block, draw its value inside the sorter
         if self.is_carrying:
-            text_surf = font.render(str(self.carrying_block_value), True, COLOR_TEXT)
-            text_rect = text_surf.get_rect(center=(self.x, self.y))
+            text_surf = text_cache.render(font, str(self.carrying_block_value), True, COLOR_TEXT)
+            text_rect = text_surf.get_rect(center=(x, y))
             screen.blit(text_surf, text_rect)
 
+    def get_rect(self, font, screen_pos=None):
+        """Returns the screen area covered by draw(), including a carried value."""
+        x, y = (self.x, self.y) if screen_pos is None else screen_pos
+        rect = pygame.Rect(int(x) - SORTER_RADIUS - 1, int(y) - SORTER_RADIUS - 1, SORTER_RADIUS * 2 + 2, SORTER_RADIUS * 2 + 2)
+        if self.is_carrying:
+            text_surf = text_cache.render(font, str(self.carrying_block_value), True, COLOR_TEXT)
+            rect.union_ip(text_surf.get_rect(center=(x, y)))
+        return rect
+
     def is_colliding_with(self, block):
         """Checks if the Sorter is close enough to a block to interact."""
         dist = math.hypot(self.x - block.x, self.y - block.y)
         return dist < (BLOCK_WIDTH / 2) + SORTER_RADIUS
 
-class DataBlock:
-    """Represents a single data block to be sorted."""
-    def __init__(self, value, original_index, total_blocks):
-        self.value = value
-        self.original_index = original_index # Stays with the object to track it
-        self.current_pos_index = original_index # Changes after swaps
-        self.update_screen_pos(total_blocks)
-        self.is_ghost = False # Is this block being "carried"?
-
-    def update_screen_pos(self, total_blocks):
-        """Calculates the x, y coordinates based on current array position."""
-        spacing = SCREEN_WIDTH / (total_blocks + 1)
-        self.x = int(spacing * (self.current_pos_index + 1))
-        self.y = int(SCREEN_HEIGHT / 2)
-
-    def draw(self, screen, font, is_min=False, is_swap_target=False):
-        """Draws the data block and its value."""
+class DataBlock(SlotHandle):
+    """Represents a single data block to be sorted.
+
+    A handle onto one slot of the game's block row (a SlotStore), which
+    holds the value, position, drawing offset and whether the block is a
+    "ghost" because the Sorter is carrying it.
+    """
+    __slots__ = ()
+
+    def get_rect(self, font, screen_x=None):
+        """Returns the screen area covered by draw(), including the value text."""
+        x = self.x + self.offset_x if screen_x is None else screen_x
+        rect = pygame.Rect(x - BLOCK_WIDTH / 2, self.y - BLOCK_HEIGHT / 2, BLOCK_WIDTH, BLOCK_HEIGHT)
+        text_surf = text_cache.render(font, str(self.value), True, COLOR_BLOCK_TEXT)
+        return rect.union(text_surf.get_rect(center=rect.center))
+
+    def draw(self, screen, font, is_min=False, is_swap_target=False, screen_x=None):
+        """Draws the data block and its value, at screen_x if the view is scrolled."""
         if self.is_ghost:
             return # Don't draw if it's being carried
         
-        rect = pygame.Rect(self.x - BLOCK_WIDTH / 2, self.y - BLOCK_HEIGHT / 2, BLOCK_WIDTH, BLOCK_HEIGHT)
+        x = self.x + self.offset_x if screen_x is None else screen_x
+        rect = pygame.Rect(x - BLOCK_WIDTH / 2, self.y - BLOCK_HEIGHT / 2, BLOCK_WIDTH, BLOCK_HEIGHT)
         
         # Draw base block
         pygame.draw.rect(screen, COLOR_BLOCK, rect, border_radius=10)
@@ -98,166 +138,447 @@ class DataBlock:
             highlight_color = COLOR_HIGHLIGHT_SWAP
 
         if highlight_color:
-            highlight_surface = pygame.Surface((BLOCK_WIDTH, BLOCK_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.rect(highlight_surface, highlight_color, (0, 0, BLOCK_WIDTH, BLOCK_HEIGHT), border_radius=10)
+            highlight_surface = overlay_cache.rounded_rect((BLOCK_WIDTH, BLOCK_HEIGHT), highlight_color, border_radius=10)
             screen.blit(highlight_surface, rect.topleft)
         
         # Value Text
-        text_surf = font.render(str(self.value), True, COLOR_BLOCK_TEXT)
+        text_surf = text_cache.render(font, str(self.value), True, COLOR_BLOCK_TEXT)
         text_rect = text_surf.get_rect(center=rect.center)
         screen.blit(text_surf, text_rect)
 
+def draw_block_bar(screen, rect, is_ghost=False, is_min=False, is_swap_target=False):
+    """Draws a block as a plain bar, the zoomed-out level of detail."""
+    if is_ghost:
+        return
+    if is_min:
+        color = COLOR_HIGHLIGHT_MIN[:3]
+    elif is_swap_target:
+        color = COLOR_HIGHLIGHT_SWAP[:3]
+    else:
+        color = COLOR_BLOCK
+    pygame.draw.rect(screen, color, rect)
+
+# Screen areas covered by the parts of the HUD
+HUD_HEADER_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, 165)
+HUD_FOOTER_RECT = pygame.Rect(0, SCREEN_HEIGHT - 55, SCREEN_WIDTH, 55)
+hud_strip = ArrayStrip((20, SCREEN_HEIGHT - 50), SCREEN_WIDTH - 40, COLOR_TEXT, "Array State:")
+# Sprites kept in the renderer's background layer, which is rebuilt only when one changes
+STATIC_SPRITES = ("hud_header", "zones") # Title, objective panel and the zone tints (which move with pass_idx)
+ZONE_RECT = pygame.Rect(0, SCREEN_HEIGHT / 2 - 70, SCREEN_WIDTH, 140)
+
 def draw_hud(screen, title_font, text_font, objective, array, pass_idx):
     """Draws all the UI text elements."""
+    draw_hud_header(screen, title_font, text_font, objective)
+    draw_hud_footer(screen, text_font, array, pass_idx)
+    draw_zones(screen, zone_split(len(array), pass_idx))
+
+def draw_hud_header(screen, title_font, text_font, objective):
+    """Draws the title and the objective panel."""
     # Title
-    title_surf = title_font.render("Selection Sorter", True, COLOR_TEXT)
+    title_surf = text_cache.render(title_font, "Selection Sorter", True, COLOR_TEXT)
     screen.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
 
     # Objective Panel
     pygame.draw.rect(screen, (0,0,0,150), [20, 80, SCREEN_WIDTH - 40, 80], border_radius=10)
-    obj_title = text_font.render("Current Objective:", True, (234, 179, 8))
+    obj_title = text_cache.render(text_font, "Current Objective:", True, (234, 179, 8))
     screen.blit(obj_title, (40, 90))
-    obj_text = text_font.render(objective, True, COLOR_TEXT)
+    obj_text = text_cache.render(text_font, objective, True, COLOR_TEXT)
     screen.blit(obj_text, (40, 120))
 
-    # Array Display
-    array_str = ' '.join([str(val) for val in array])
-    arr_surf = text_font.render(f"Array State: {array_str}", True, COLOR_TEXT)
-    screen.blit(arr_surf, (20, SCREEN_HEIGHT - 50))
-    
-    # Draw zone indicators
-    if 0 < pass_idx < len(array):
-        spacing = SCREEN_WIDTH / (len(array) + 1)
-        split_point = spacing * (pass_idx + 0.5)
-        
+def draw_hud_footer(screen, text_font, array, pass_idx=0):
+    """Draws the array state line."""
+    # Array Display, scrolled to keep the current pass in view
+    hud_strip.draw(screen, text_font, array, pass_idx)
+
+def block_detail_spacing(total_blocks):
+    """Slot width a block and its label need to be drawn in full."""
+    return max(BLOCK_WIDTH, label_width(total_blocks, BLOCK_DIGIT_WIDTH) + LABEL_GAP)
+
+def block_spacing(total_blocks):
+    """World distance between blocks; long labels push the blocks apart."""
+    return slot_spacing(total_blocks, max(BLOCK_MIN_SPACING, block_detail_spacing(total_blocks)), SCREEN_WIDTH)
+
+def zone_split(total_blocks, pass_idx, camera=None):
+    """Screen x where the sorted zone ends, or None before the first swap."""
+    if not 0 < pass_idx < total_blocks:
+        return None
+    spacing = block_spacing(total_blocks)
+    split_point = spacing * (pass_idx + 0.5)
+    if camera is not None:
+        split_point = camera.to_screen_x(split_point)
+    return min(max(split_point, 0), SCREEN_WIDTH)
+
+def draw_zones(screen, split_point):
+    """Tints the sorted and unsorted parts of the row either side of split_point."""
+    if split_point is not None:
+        # Zone tints are full-width surfaces cropped to each zone when blitted
+        zone_size = (SCREEN_WIDTH, 140)
+
         # Sorted Zone
         sorted_rect = pygame.Rect(0, SCREEN_HEIGHT/2 - 70, split_point, 140)
-        sorted_surface = pygame.Surface(sorted_rect.size, pygame.SRCALPHA)
-        sorted_surface.fill(COLOR_SORTED_ZONE)
-        screen.blit(sorted_surface, sorted_rect.topleft)
+        sorted_surface = overlay_cache.fill(zone_size, COLOR_SORTED_ZONE)
+        screen.blit(sorted_surface, sorted_rect.topleft, (0, 0) + sorted_rect.size)
         
         # Unsorted Zone
         unsorted_rect = pygame.Rect(split_point, SCREEN_HEIGHT/2 - 70, SCREEN_WIDTH - split_point, 140)
-        unsorted_surface = pygame.Surface(unsorted_rect.size, pygame.SRCALPHA)
-        unsorted_surface.fill(COLOR_UNSORTED_ZONE)
-        screen.blit(unsorted_surface, unsorted_rect.topleft)
+        unsorted_surface = overlay_cache.fill(zone_size, COLOR_UNSORTED_ZONE)
+        screen.blit(unsorted_surface, unsorted_rect.topleft, (0, 0) + unsorted_rect.size)
 
-def main():
-    """Main function to run the game."""
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Selection Sorter Game")
-    clock = pygame.time.Clock()
+class SelectionSortGame:
+    """The selection sort state machine, advanced one tick at a time.
 
-    # --- Fonts ---
-    title_font = pygame.font.Font(None, 50)
-    text_font = pygame.font.Font(None, 32)
-    block_font = pygame.font.Font(None, 45)
-
-    # --- Game Variables ---
-    game_state = "READY"
-    objective = "Press SPACE to begin sorting!"
-    
-    array_to_sort = []
-    blocks = []
-    sorter = Sorter(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
-    
-    # Selection Sort specific variables
-    current_pass_index = 0
-    min_element_index = 0
-
-    def reset_game():
-        nonlocal array_to_sort, blocks, current_pass_index, min_element_index, game_state, objective
-        game_state = "READY"
-        objective = "Press SPACE to begin sorting! (R to Reset)"
-        
-        array_to_sort = random.sample(range(10, 100), 8)
-        blocks = [DataBlock(val, i, len(array_to_sort)) for i, val in enumerate(array_to_sort)]
-        
-        current_pass_index = 0
-        min_element_index = 0
-        sorter.is_carrying = False
-        sorter.carrying_block_value = None
-        for block in blocks: block.is_ghost = False
-
-    def start_new_pass():
-        nonlocal game_state, objective, min_element_index
-        if current_pass_index >= len(array_to_sort) - 1:
-            game_state = "FINISHED"
-            objective = "Array sorted! Press SPACE to play again."
+    Holds no references to the display or clock. Pauses and animations run
+    on `scheduler`, which advances by TICK_MS of simulated time per step.
+    """
+    def __init__(self, seed=None, size=8, layout="random"):
+        if not 2 <= size <= MAX_ARRAY_SIZE:
+            raise ValueError(f"array size must be between 2 and {MAX_ARRAY_SIZE}, got {size}")
+        self.rng = random.Random(seed)
+        self.size = size
+        self.layout = layout
+        self.scheduler = Scheduler()
+        self.sorter = Sorter(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150)
+        self.ticks = 0
+        self.generation = 0 # Bumped on every reset
+        self.state_changed = False # Whether the last tick moved the state machine on
+        self.reset()
+
+    @property
+    def finished(self):
+        return self.state == "FINISHED"
+
+    def is_idle(self, inputs):
+        """True when a tick with these held keys would change nothing on screen."""
+        moving = inputs.left or inputs.right or inputs.up or inputs.down
+        sorter = self.sorter
+        at_rest = (sorter.x, sorter.y) == (sorter.prev_x, sorter.prev_y)
+        # A state change can set up an action for the very next tick (picking
+        # up a block already on the swap target swaps it straight away)
+        return not moving and at_rest and not self.scheduler.busy and not self.state_changed
+
+    def reset(self):
+        """Resets the game to its initial state."""
+        self.generation += 1
+        self.scheduler.clear()
+        self.state = "READY"
+        self.objective = "Press SPACE to begin sorting! (R to Reset)"
+
+        values = value_range(self.size)
+        self.max_value = values[-1]
+        self.detail_spacing = block_detail_spacing(self.size)
+        self.spacing = block_spacing(self.size)
+        self.blocks = SlotStore(DataBlock, initial_array(self.rng, self.size, self.layout),
+                                self.spacing, int(SCREEN_HEIGHT / 2))
+        self.array_to_sort = self.blocks.value # Swapping here swaps the blocks too
+        self.min_tree = MinSegmentTree(self.array_to_sort)
+        self.world_width = int(self.spacing * (self.size + 1))
+        self.sorter.world_width = self.world_width
+
+        # Selection Sort specific variables
+        self.current_pass_index = 0
+        self.min_element_index = 0
+        self.sorter.is_carrying = False
+        self.sorter.carrying_block_value = None
+
+    def start_new_pass(self):
+        """Finds the minimum of the unsorted part, or finishes the game."""
+        array = self.array_to_sort
+        if self.current_pass_index >= len(array) - 1:
+            self.state = "FINISHED"
+            self.objective = "Array sorted! Press SPACE to play again."
             return
 
         # Find the minimum element in the unsorted part
-        min_val = array_to_sort[current_pass_index]
-        min_element_index = current_pass_index
-        for i in range(current_pass_index + 1, len(array_to_sort)):
-            if array_to_sort[i] < min_val:
-                min_val = array_to_sort[i]
-                min_element_index = i
-        
-        objective = f"Minimum is {array_to_sort[min_element_index]}. Move to the GREEN highlighted block to pick it up."
-        game_state = "MOVE_TO_MIN"
+        self.min_element_index = self.min_tree.argmin(self.current_pass_index)
 
-    reset_game()
+        self.objective = f"Minimum is {array[self.min_element_index]}. Move to the GREEN highlighted block to pick it up."
+        self.state = "MOVE_TO_MIN"
 
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    reset_game()
-                if event.key == pygame.K_SPACE and game_state in ["READY", "FINISHED"]:
-                    reset_game()
-                    game_state = "START_PASS"
-
-        if game_state == "START_PASS":
-            start_new_pass()
-            
-        sorter.move()
+    def finish_swap(self):
+        """Ends the post-swap pause and moves on to the next pass."""
+        self.current_pass_index += 1
+        self.state = "START_PASS"
+
+    def step(self, inputs):
+        """Advances the game by one tick using the given InputState."""
+        self.ticks += 1
+        state = self.state
+        self.scheduler.update(TICK_MS)
+        self.sorter.prev_x, self.sorter.prev_y = self.sorter.x, self.sorter.y
+
+        if inputs.reset:
+            self.reset()
+        if inputs.space and self.state in ["READY", "FINISHED"]:
+            self.reset()
+            self.state = "START_PASS"
+
+        if self.state == "START_PASS":
+            self.start_new_pass()
+
+        self.sorter.move(inputs)
 
         # --- Game Logic (State Machine based on Collision) ---
-        if game_state == "MOVE_TO_MIN":
-            min_block = blocks[min_element_index]
-            if sorter.is_colliding_with(min_block):
-                sorter.is_carrying = True
-                sorter.carrying_block_value = min_block.value
+        if self.state == "MOVE_TO_MIN":
+            min_block = self.blocks[self.min_element_index]
+            if self.sorter.is_colliding_with(min_block):
+                self.sorter.is_carrying = True
+                self.sorter.carrying_block_value = min_block.value
                 min_block.is_ghost = True
-                objective = f"Block acquired! Now move to the CYAN swap target at position {current_pass_index}."
-                game_state = "CARRYING_TO_SWAP"
+                self.objective = f"Block acquired! Now move to the CYAN swap target at position {self.current_pass_index}."
+                self.state = "CARRYING_TO_SWAP"
 
-        elif game_state == "CARRYING_TO_SWAP":
-            swap_block = blocks[current_pass_index]
-            if sorter.is_colliding_with(swap_block):
+        elif self.state == "CARRYING_TO_SWAP":
+            pass_idx, min_idx = self.current_pass_index, self.min_element_index
+            swap_block = self.blocks[pass_idx]
+            if self.sorter.is_colliding_with(swap_block):
                 # Perform the swap
-                array_to_sort[current_pass_index], array_to_sort[min_element_index] = array_to_sort[min_element_index], array_to_sort[current_pass_index]
-                # Update block values and visual positions
-                blocks[current_pass_index].value, blocks[min_element_index].value = blocks[min_element_index].value, blocks[current_pass_index].value
-                
+                self.array_to_sort[pass_idx], self.array_to_sort[min_idx] = self.array_to_sort[min_idx], self.array_to_sort[pass_idx]
+                self.min_tree.update(pass_idx)
+                self.min_tree.update(min_idx)
+
                 # Reset sorter and ghost block
-                sorter.is_carrying = False
-                blocks[min_element_index].is_ghost = False
-                
-                objective = "Swap complete! Starting next pass..."
-                game_state = "SWAPPING"
-                pygame.time.wait(1000) # Pause to show the result
-                current_pass_index += 1
-                game_state = "START_PASS"
+                self.sorter.is_carrying = False
+                self.blocks[min_idx].is_ghost = False
+
+                # Slide the displaced block from the swap target to its new slot
+                displaced = self.blocks[min_idx]
+                self.scheduler.tween(displaced, "offset_x", swap_block.x - displaced.x, 0.0, SWAP_SLIDE_MS)
+
+                self.objective = "Swap complete! Starting next pass..."
+                self.state = "SWAPPING"
+                self.scheduler.after(SWAP_PAUSE_MS, self.finish_swap) # Pause to show the result
+
+        self.state_changed = self.state != state
+
+    # --- Auto-Play ---
+    def auto_ops(self):
+        """The rest of the sort as a lazy stream of compare and swap operations."""
+        return selection_sort_ops(self.array_to_sort)
+
+    def show_auto(self, player):
+        """Shows an AutoPlayer's progress: the Sorter stands at the block being scanned."""
+        self.objective = player.status
+        array = self.array_to_sort
+        if player.finished:
+            if self.state != "FINISHED":
+                # The stream swapped behind the tree's back; catch it up once
+                self.min_tree = MinSegmentTree(array)
+            self.state = "FINISHED"
+            self.current_pass_index = len(array) - 1
+            return
+        self.state = "AUTO_PLAY"
+        self.current_pass_index = player.swaps # One swap ends every pass
+        scan_index = self.current_pass_index
+        if player.last_op is not None:
+            kind, i, j = player.last_op
+            self.min_element_index = i if kind == COMPARE else j
+            scan_index = j
+        self.sorter.x = self.sorter.prev_x = self.blocks.x[scan_index]
+        self.sorter.prev_y = self.sorter.y
+
+def build_scene(game, camera, title_font, text_font, block_font, alpha=1.0):
+    """Describes the frame as a back-to-front sprite list for SceneRenderer.
+
+    Only blocks inside the camera view are included. The Sorter is drawn
+    `alpha` of the way from its previous to its current simulated position.
+    """
+    array = game.array_to_sort
+    pass_idx = game.current_pass_index
+    shown = hud_strip.window(text_font, len(array), pass_idx)
+    split_point = zone_split(len(array), pass_idx, camera)
+    sprites = [
+        ("hud_header", HUD_HEADER_RECT, game.objective, draw_hud_header, (title_font, text_font, game.objective)),
+        ("hud_footer", HUD_FOOTER_RECT, tuple(array[shown.start:shown.stop]), draw_hud_footer, (text_font, array, pass_idx)),
+        ("zones", ZONE_RECT, split_point, draw_zones, (split_point,)),
+    ]
+    base_y = int(SCREEN_HEIGHT / 2) + BLOCK_HEIGHT // 2
+
+    # Blocks are read straight from the row's arrays; a handle is only made
+    # for blocks drawn in full
+    blocks = game.blocks
+    xs, values, offsets, ghosts = blocks.x, blocks.value, blocks.offsets, blocks.ghosts
+    min_idx = game.min_element_index if game.state in ("MOVE_TO_MIN", "AUTO_PLAY") else None
+    swap_idx = pass_idx if game.state in ("CARRYING_TO_SWAP", "AUTO_PLAY") else None
+    detailed = camera.detailed
+    for i in camera.visible_slots(len(blocks)):
+        is_min = i == min_idx
+        is_swap = i == swap_idx
+        is_ghost = i in ghosts
+        world_x = xs[i] + offsets.get(i, 0.0)
+        if detailed:
+            block = blocks[i]
+            x = camera.to_screen_x(world_x)
+            sprites.append((("block", i), block.get_rect(block_font, x),
+                            (x, blocks.y, values[i], is_ghost, is_min, is_swap),
+                            block.draw, (block_font, is_min, is_swap, x)))
+        else:
+            rect = camera.bar_rect(world_x, base_y, values[i], game.max_value)
+            sprites.append((("block", i), rect, (rect, is_ghost, is_min, is_swap),
+                            draw_block_bar, (rect, is_ghost, is_min, is_swap)))
+
+    sorter = game.sorter
+    sorter_pos = (camera.to_screen_x(lerp(sorter.prev_x, sorter.x, alpha)), int(lerp(sorter.prev_y, sorter.y, alpha)))
+    sprites.append(("sorter", sorter.get_rect(block_font, sorter_pos),
+                    (sorter_pos, sorter.is_carrying, sorter.carrying_block_value),
+                    sorter.draw, (block_font, sorter_pos)))
+    return sprites
+
+def main(argv=None):
+    """Main function to run the game."""
+    startup = StartupProfile()
+    parser = argparse.ArgumentParser(description="Selection Sorter")
+    parser.add_argument("--size", type=int, default=8,
+                        help=f"number of blocks to sort (2-{MAX_ARRAY_SIZE})")
+    parser.add_argument("--max-fps", type=int, default=FPS,
+                        help=f"cap on rendered frames per second, 0 for uncapped; the game always simulates {TICK_RATE} ticks/s")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only repaint and push the screen regions that changed each frame")
+    parser.add_argument("--trace", metavar="OUT.json",
+                        help="stream per-frame phase timings to a Chrome trace file (F3 toggles the on-screen overlay)")
+    parser.add_argument("--no-idle", action="store_true",
+                        help="keep redrawing at full rate even while nothing on screen can change")
+    parser.add_argument("--cpu-report", action="store_true", help="print CPU use of idle and active frames on exit")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print the time to the first frame, broken down by startup phase")
+    parser.add_argument("--seed", type=int, help="seed for the shuffled array (random by default)")
+    parser.add_argument("--record", metavar="LOG", help="write the seed and every tick's input to a replayable log")
+    parser.add_argument("--replay", metavar="LOG", help="play back a log written with --record at normal speed")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay, run the log as fast as possible without a window and check its result")
+    parser.add_argument("--auto", nargs="?", const=1, type=int, metavar="OPS",
+                        help="watch the sort play itself, OPS compares and swaps per frame (default 1; [ and ] halve and double it)")
+    parser.add_argument("--auto-budget-ms", type=float, default=AUTO_BUDGET_MS,
+                        help=f"with --auto, most time per frame spent sorting (default {AUTO_BUDGET_MS:g})")
+    args = parser.parse_args(argv)
+    if not 2 <= args.size <= MAX_ARRAY_SIZE:
+        parser.error(f"--size must be between 2 and {MAX_ARRAY_SIZE}")
+    if args.seed is not None and not 0 <= args.seed <= MAX_SEED:
+        parser.error(f"--seed must be between 0 and {MAX_SEED}")
+    if args.record and args.replay:
+        parser.error("--record and --replay can't be combined")
+    if args.headless and not args.replay:
+        parser.error("--headless needs --replay")
+    if args.auto is not None and (args.record or args.replay):
+        parser.error("--auto can't be combined with --record or --replay")
+    if args.auto is not None and args.auto < 1:
+        parser.error("--auto needs at least 1 operation per frame")
+
+    log = None
+    if args.replay:
+        try:
+            log = InputLog.load(args.replay)
+            log.check_compatible(GAME_NAME, TICK_RATE)
+        except (OSError, ValueError) as e:
+            parser.error(f"can't replay {args.replay}: {e}")
+        if args.headless:
+            ok, description = verify(log)
+            print(description)
+            sys.exit(0 if ok else 1)
+    seed = log.seed if log else args.seed if args.seed is not None else random.randrange(2 ** 32)
+    size = log.size if log else args.size
+
+    with startup.phase("init"):
+        init_subsystems()
+    # --- Fonts ---
+    # Loaded in the background while the window opens and the game is built
+    fonts = FontLoader((TITLE_FONT_SIZE, TEXT_FONT_SIZE, BLOCK_FONT_SIZE))
+    with startup.phase("display"):
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Selection Sorter Game")
+    clock = pygame.time.Clock()
+
+    with startup.phase("game"):
+        game = SelectionSortGame(seed=seed, size=size)
+    with startup.phase("fonts"):
+        title_font = fonts.get(TITLE_FONT_SIZE)
+        text_font = fonts.get(TEXT_FONT_SIZE)
+        block_font = fonts.get(BLOCK_FONT_SIZE)
+    camera = Camera(SCREEN_WIDTH, game.world_width, game.spacing, game.detail_spacing)
+    trace = TraceWriter(args.trace, "Selection Sorter") if args.trace else None
+    profiler = FrameProfiler(trace=trace)
+    renderer = SceneRenderer(screen, COLOR_BACKGROUND, dirty_rects=args.dirty_rects, profiler=profiler,
+                             static_keys=STATIC_SPRITES)
+    recorder = InputRecorder(args.record, GAME_NAME, seed, size, TICK_RATE) if args.record else None
+    driver = FixedStepDriver(game, TICK_MS, script=log.inputs() if log else None, recorder=recorder)
+    # Replays feed input the window never sees, so they always run at full rate
+    governor = FrameGovernor(clock, args.max_fps, enabled=not args.no_idle and log is None)
+    autoplay = AutoPlayer(game, args.auto, args.auto_budget_ms) if args.auto is not None else None
+    generation = game.generation
+    last_frame = time.perf_counter()
+
+    loop_start = time.perf_counter()
+    running = True
+    while running:
+        profiler.begin_frame()
+
+        # --- Event Handling ---
+        with profiler.phase("events"):
+            events = governor.events()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                    renderer.invalidate()
+                if event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                        camera.zoom_by(0.5)
+                    if event.key in (pygame.K_EQUALS, pygame.K_KP_PLUS):
+                        camera.zoom_by(2)
+                    if autoplay is not None and event.key == pygame.K_LEFTBRACKET:
+                        autoplay.scale_speed(0.5)
+                    if autoplay is not None and event.key == pygame.K_RIGHTBRACKET:
+                        autoplay.scale_speed(2)
+                    if event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                        renderer.invalidate()
+            inputs = read_input(events)
+
+        # --- Fixed-Timestep Update ---
+        with profiler.phase("update"):
+            now = time.perf_counter()
+            if autoplay is not None:
+                autoplay.handle(inputs)
+                autoplay.run_frame()
+            else:
+                driver.update((now - last_frame) * 1000, inputs)
+            last_frame = now
+            if game.generation != generation:
+                generation = game.generation
+                camera.set_world(game.world_width, game.spacing, game.detail_spacing)
+                renderer.invalidate()
+            camera.follow(lerp(game.sorter.prev_x, game.sorter.x, driver.alpha))
 
         # --- Drawing ---
-        screen.fill(COLOR_BACKGROUND)
-        draw_hud(screen, title_font, text_font, objective, array_to_sort, current_pass_index)
-        
-        for block in blocks:
-            is_min = (game_state == "MOVE_TO_MIN" and block.current_pos_index == min_element_index)
-            is_swap = (game_state == "CARRYING_TO_SWAP" and block.current_pos_index == current_pass_index)
-            block.draw(screen, block_font, is_min, is_swap)
+        with profiler.phase("build_scene"):
+            sprites = build_scene(game, camera, title_font, text_font, block_font, driver.alpha)
+            if profiler.overlay_visible:
+                sprites.append(profiler.overlay_sprite(SCREEN_WIDTH, fonts.get(OVERLAY_FONT_SIZE)))
+        renderer.render(sprites)
+        if startup is not None:
+            startup.add("first_frame", time.perf_counter() - loop_start)
+            startup.frame_presented()
+            if args.startup_profile:
+                print(startup.report())
+            startup = None
 
-        sorter.draw(screen, block_font)
-        pygame.display.flip()
-        clock.tick(FPS)
+        with profiler.phase("wait"):
+            if autoplay is not None:
+                idle = autoplay.idle and not profiler.overlay_visible
+            else:
+                idle = game.is_idle(inputs) and not driver.pending_input and not profiler.overlay_visible
+            if governor.end_frame(idle):
+                # Whatever ended the wait gets a tick straight away, without
+                # catching up on the time spent asleep
+                last_frame = time.perf_counter() - TICK_MS / 1000
+        profiler.end_frame()
 
+    if trace is not None:
+        trace.close()
+    if args.cpu_report:
+        print(governor.meter.report())
+    if recorder is not None:
+        recorder.close(game)
+        print(f"Recorded {recorder.ticks} ticks (seed {seed}) to {args.record}")
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,60 @@
+# --- Range-Minimum Tree ---
+# Selection sort looks for the minimum of the unsorted suffix at the start of
+# every pass. Rescanning the suffix makes a full game O(n^2); this tree
+# answers the same question in O(log n) and absorbs each swap in O(log n).
+
+
+class MinSegmentTree:
+    """Segment tree of indices into a list, ordered by (value, index).
+
+    The tree keeps a reference to `values` rather than a copy. After changing
+    values[i] in place, call update(i) so the tree sees the new value. Ties
+    resolve to the lowest index, matching a left-to-right scan with `<`.
+    """
+    def __init__(self, values):
+        self.values = values
+        self.size = 1
+        while self.size < len(values):
+            self.size *= 2
+        # Node k covers its children 2k and 2k+1; leaves start at `size`.
+        # -1 marks an empty slot past the end of the list.
+        self.tree = [-1] * (2 * self.size)
+        self.tree[self.size:self.size + len(values)] = range(len(values))
+        for k in range(self.size - 1, 0, -1):
+            self.tree[k] = self._better(self.tree[2 * k], self.tree[2 * k + 1])
+
+    def _better(self, a, b):
+        """Returns whichever of two indices holds the smaller value."""
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        value_a, value_b = self.values[a], self.values[b]
+        if value_a < value_b or (value_a == value_b and a < b):
+            return a
+        return b
+
+    def update(self, i):
+        """Re-reads values[i] after it was changed and repairs its ancestors."""
+        k = (i + self.size) // 2
+        while k:
+            self.tree[k] = self._better(self.tree[2 * k], self.tree[2 * k + 1])
+            k //= 2
+
+    def argmin(self, lo=0, hi=None):
+        """Index of the smallest value in values[lo:hi], or -1 if empty."""
+        if hi is None:
+            hi = len(self.values)
+        best = -1
+        lo += self.size
+        hi += self.size
+        while lo < hi:
+            if lo & 1:
+                best = self._better(best, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = self._better(best, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return best
@@ -0,0 +1,227 @@
+import json
+import time
+from collections import deque
+
+import pygame
+
+# --- Frame Profiler ---
+# Times each phase of the main loop (event pumping, simulation, scene
+# building, drawing, presenting) and keeps a rolling window of per-frame
+# samples. The data can be shown as an on-screen overlay (F3 in both games)
+# and/or streamed to a Chrome trace file (--trace out.json), which opens in
+# chrome://tracing or https://ui.perfetto.dev.
+
+OVERLAY_REFRESH_FRAMES = 15 # Re-render the overlay text four times a second at 60 FPS
+OVERLAY_WIDTH = 330
+OVERLAY_COLUMN_WIDTH = 55
+OVERLAY_GRAPH_HEIGHT = 60
+OVERLAY_GRAPH_MAX_MS = 33.3
+COLOR_OVERLAY_BG = (0, 0, 0)
+COLOR_OVERLAY_TEXT = (200, 255, 200)
+COLOR_OVERLAY_BAR = (90, 200, 90)
+COLOR_OVERLAY_SLOW_BAR = (230, 80, 60)
+COLOR_OVERLAY_BUDGET = (240, 240, 240)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class _Phase:
+    """Context manager returned by FrameProfiler.phase() and StartupProfile.phase()."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.profiler.add(self.name, end - self.start, self.start)
+        return False
+
+
+class StartupProfile:
+    """Times the phases between launch and the first presented frame."""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = [] # (name, seconds)
+        self.first_frame = None # Seconds from start to the first frame
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def add(self, name, seconds, start=None):
+        self.phases.append((name, seconds))
+
+    def frame_presented(self):
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.start
+
+    def report(self):
+        total = self.first_frame if self.first_frame is not None else time.perf_counter() - self.start
+        lines = [f"Time to first frame: {total * 1000:.1f} ms"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<12} {seconds * 1000:8.1f} ms")
+        other = total - sum(seconds for _, seconds in self.phases)
+        lines.append(f"  {'(other)':<12} {other * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class TraceWriter:
+    """Streams profiler samples to a file in Chrome's trace event format.
+
+    Events are written as each frame ends, so a trace survives the game
+    being killed; the closing bracket is optional for the trace viewers.
+    """
+    def __init__(self, path, process_name="game"):
+        self.file = open(path, "w")
+        self.origin = time.perf_counter()
+        self.file.write("[\n")
+        self._write({"name": "process_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": process_name}}, first=True)
+        self.file.flush()
+
+    def _write(self, event, first=False):
+        if not first:
+            self.file.write(",\n")
+        self.file.write(json.dumps(event, separators=(",", ":")))
+
+    def _us(self, timestamp):
+        return round((timestamp - self.origin) * 1e6, 1)
+
+    def write_frame(self, index, start, end, spans, totals):
+        """Writes one frame: its span, each timed phase, and per-category totals."""
+        self._write({"name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                     "ts": self._us(start), "dur": round((end - start) * 1e6, 1), "args": {"frame": index}})
+        for name, phase_start, duration in spans:
+            self._write({"name": name, "cat": "phase", "ph": "X", "pid": 1, "tid": 1,
+                         "ts": self._us(phase_start), "dur": round(duration * 1e6, 1)})
+        self._write({"name": "phase_ms", "ph": "C", "pid": 1, "tid": 1, "ts": self._us(start),
+                     "args": {name: round(seconds * 1000, 3) for name, seconds in totals.items()}})
+        self.file.flush() # Each frame reaches disk whole, even if the game is then killed
+
+    def close(self):
+        if not self.file.closed:
+            self.file.write("\n]\n")
+            self.file.close()
+
+
+class FrameProfiler:
+    """Collects per-phase timings for each frame over a rolling window.
+
+    Wrap top-level loop phases in `with profiler.phase(name):`. Code that
+    runs many small pieces of work (like drawing each sprite) can instead
+    call add(name, seconds) to accumulate into a phase. Set `detailed` when
+    that fine-grained timing is worth its own overhead.
+    """
+    def __init__(self, window=240, trace=None):
+        self.window = window
+        self.frames = deque(maxlen=window) # (frame_seconds, {phase: seconds})
+        self.trace = trace
+        self.overlay_visible = False
+        self.frame_index = 0
+        self._frame_start = None
+        self._totals = {}
+        self._spans = []
+        self._overlay_lines = []
+
+    @property
+    def detailed(self):
+        return self.overlay_visible or self.trace is not None
+
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+        self._totals = {}
+        self._spans = []
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def add(self, name, seconds, start=None):
+        """Adds seconds to a phase; pass start to also record it as a trace span."""
+        self._totals[name] = self._totals.get(name, 0.0) + seconds
+        if start is not None and self.trace is not None:
+            self._spans.append((name, start, seconds))
+
+    def end_frame(self):
+        end = time.perf_counter()
+        if self._frame_start is None:
+            return
+        self.frames.append((end - self._frame_start, self._totals))
+        if self.trace is not None:
+            self.trace.write_frame(self.frame_index, self._frame_start, end, self._spans, self._totals)
+        self.frame_index += 1
+
+    def phase_names(self):
+        names = []
+        for _, totals in self.frames:
+            for name in totals:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def stats(self, pcts=(50, 95, 99)):
+        """Percentiles in milliseconds for the whole frame and every phase."""
+        frame_times = sorted(seconds * 1000 for seconds, _ in self.frames)
+        result = {"frame": [percentile(frame_times, p) for p in pcts]}
+        for name in self.phase_names():
+            values = sorted(totals.get(name, 0.0) * 1000 for _, totals in self.frames)
+            result[name] = [percentile(values, p) for p in pcts]
+        return result
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_lines = []
+
+    # --- Overlay ---
+
+    def overlay_rect(self, screen_width, font):
+        line_count = len(self._overlay_lines) or 1
+        height = line_count * font.get_linesize() + OVERLAY_GRAPH_HEIGHT + 16
+        return pygame.Rect(screen_width - OVERLAY_WIDTH - 10, 10, OVERLAY_WIDTH, height)
+
+    def overlay_sprite(self, screen_width, font):
+        """The overlay as a SceneRenderer sprite; it changes every frame."""
+        rect = self.overlay_rect(screen_width, font)
+        return ("profiler", rect, self.frame_index, self.draw_overlay, (font, rect))
+
+    def draw_overlay(self, screen, font, rect):
+        """Draws the percentile table and frame-time graph inside rect."""
+        # Text only changes a few times a second so it stays readable and
+        # doesn't churn the shared text cache.
+        if not self._overlay_lines or self.frame_index % OVERLAY_REFRESH_FRAMES == 0:
+            rows = [("ms", "p50", "p95", "p99")]
+            for name, values in self.stats().items():
+                rows.append((name,) + tuple(f"{v:.2f}" for v in values))
+            self._overlay_lines = [[font.render(cell, True, COLOR_OVERLAY_TEXT) for cell in row] for row in rows]
+
+        pygame.draw.rect(screen, COLOR_OVERLAY_BG, rect)
+        y = rect.top + 4
+        for name_surf, *value_surfs in self._overlay_lines:
+            screen.blit(name_surf, (rect.left + 6, y))
+            for column, surf in enumerate(value_surfs):
+                right = rect.right - 6 - (len(value_surfs) - 1 - column) * OVERLAY_COLUMN_WIDTH
+                screen.blit(surf, (right - surf.get_width(), y))
+            y += font.get_linesize()
+
+        # Frame-time graph, newest on the right; the white line is the 60 FPS budget
+        graph_bottom = rect.bottom - 6
+        scale = OVERLAY_GRAPH_HEIGHT / OVERLAY_GRAPH_MAX_MS
+        frames = list(self.frames)[-(rect.width - 12):]
+        x = rect.right - 6 - len(frames)
+        for seconds, _ in frames:
+            ms = seconds * 1000
+            height = max(1, min(OVERLAY_GRAPH_HEIGHT, int(ms * scale)))
+            color = COLOR_OVERLAY_SLOW_BAR if ms > 1000 / 60 else COLOR_OVERLAY_BAR
+            pygame.draw.line(screen, color, (x, graph_bottom), (x, graph_bottom - height))
+            x += 1
+        budget_y = graph_bottom - int(1000 / 60 * scale)
+        pygame.draw.line(screen, COLOR_OVERLAY_BUDGET, (rect.left + 6, budget_y), (rect.right - 6, budget_y))
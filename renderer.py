@@ -0,0 +1,188 @@
+import time
+
+import pygame
+
+# --- Dirty-Rectangle Rendering ---
+# Each frame the games describe their scene as a back-to-front list of
+# sprites: (key, rect, signature, draw, args). `rect` bounds everything the
+# sprite draws, `signature` is any value that changes whenever its pixels
+# would, and draw(screen, *args) paints it. Comparing the list against the
+# previous frame tells us which screen regions actually need repainting.
+#
+# Sprites that rarely change (titles, panels, zone tints) can be named as
+# static: they are composited with the background fill into an off-screen
+# layer that is only rebuilt when one of them changes, and every frame
+# starts from a single blit of that layer.
+
+# Past this many separate regions it is cheaper to repaint the whole screen
+# (or their union, once merged) than to repaint them one by one.
+MAX_DIRTY_RECTS = 24
+
+
+def merge_rects(rects):
+    """Merges overlapping rects so no screen area is repainted twice."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    if len(merged) > MAX_DIRTY_RECTS:
+        merged = [merged[0].unionall(merged[1:])]
+    return merged
+
+
+class SceneRenderer:
+    """Draws a sprite list to the screen, either in full or by dirty rects.
+
+    With dirty rects enabled only sprites whose rect or signature changed
+    since the last frame are repainted, and only those regions are pushed
+    with pygame.display.update(). Call invalidate() to force the next frame
+    to be a full redraw, e.g. after a reset or when the window is resized or
+    exposed.
+
+    Sprites whose key is in static_keys go into the background layer
+    instead of being drawn each frame, beneath all other sprites.
+    `layer_hits` and `layer_builds` count frames that reused the layer and
+    frames that had to rebuild it.
+
+    If a FrameProfiler is attached, drawing and presenting are timed as the
+    "draw" and "present" phases, and in detailed mode each sprite's draw
+    time is also added to a "draw:<kind>" phase named after its key.
+    Rebuilding the background layer is timed as "layer".
+    """
+    def __init__(self, screen, background, dirty_rects=False, profiler=None, static_keys=()):
+        self.screen = screen
+        self.background = background
+        self.dirty_rects = dirty_rects
+        self.profiler = profiler
+        self.static_keys = frozenset(static_keys)
+        self.layer_hits = 0
+        self.layer_builds = 0
+        self._layer = None
+        self._layer_state = None
+        self._previous = {}
+        self._needs_full_redraw = True
+
+    def invalidate(self):
+        """Makes the next render() rebuild the background layer and flip the whole screen."""
+        self._needs_full_redraw = True
+        self._layer_state = None
+
+    @property
+    def layer_hit_rate(self):
+        frames = self.layer_hits + self.layer_builds
+        return self.layer_hits / frames if frames else 0.0
+
+    def _update_layer(self, static):
+        """Rebuilds the background layer if any static sprite changed."""
+        state = [(key, rect, signature) for key, rect, signature, _, _ in static]
+        if self._layer is None or self._layer.get_size() != self.screen.get_size():
+            self._layer = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            self._layer_state = None
+        if state == self._layer_state:
+            self.layer_hits += 1
+            return
+        start = time.perf_counter()
+        self._layer.fill(self.background)
+        for key, rect, signature, draw, args in static:
+            draw(self._layer, *args)
+        self._layer_state = state
+        self.layer_builds += 1
+        if self.profiler is not None:
+            self.profiler.add("layer", time.perf_counter() - start, start)
+
+    def render(self, sprites):
+        """Draws the sprites and updates the display.
+
+        Returns the list of rects that were pushed to the display.
+        """
+        screen = self.screen
+        current = {}
+        for key, rect, signature, draw, args in sprites:
+            current[key] = (rect, signature)
+        static_keys = self.static_keys
+        if static_keys:
+            static = [sprite for sprite in sprites if sprite[0] in static_keys]
+            sprites = [sprite for sprite in sprites if sprite[0] not in static_keys]
+            self._update_layer(static)
+
+        if not self.dirty_rects or self._needs_full_redraw:
+            return self._redraw_all(sprites, current)
+
+        dirty = []
+        previous = self._previous
+        for key, state in current.items():
+            old = previous.get(key)
+            if old != state:
+                dirty.append(state[0])
+                if old is not None:
+                    dirty.append(old[0])
+        for key, old in previous.items():
+            if key not in current:
+                dirty.append(old[0])
+        if len(dirty) > MAX_DIRTY_RECTS:
+            # Merging is quadratic in the number of rects; a zoomed-out,
+            # scrolling row dirties hundreds of bars, so just redraw
+            return self._redraw_all(sprites, current)
+        self._previous = current
+        if not dirty:
+            return []
+
+        start = time.perf_counter()
+        regions = merge_rects(dirty)
+        for region in regions:
+            screen.set_clip(region)
+            self._clear(region)
+            self._draw_sprites(sprites, region)
+        screen.set_clip(None)
+        self._present(start, regions)
+        return regions
+
+    def _redraw_all(self, sprites, current):
+        start = time.perf_counter()
+        self._clear()
+        self._draw_sprites(sprites)
+        self._present(start, None)
+        self._previous = current
+        self._needs_full_redraw = False
+        return [self.screen.get_rect()]
+
+    def _clear(self, region=None):
+        """Paints the background layer (or plain fill) over region, or the whole screen."""
+        if self.static_keys:
+            self.screen.blit(self._layer, region or (0, 0), region)
+        else:
+            self.screen.fill(self.background, region)
+
+    def _draw_sprites(self, sprites, region=None):
+        screen = self.screen
+        profiler = self.profiler
+        if profiler is None or not profiler.detailed:
+            for key, rect, signature, draw, args in sprites:
+                if region is None or region.colliderect(rect):
+                    draw(screen, *args)
+            return
+
+        clock = time.perf_counter
+        for key, rect, signature, draw, args in sprites:
+            if region is None or region.colliderect(rect):
+                start = clock()
+                draw(screen, *args)
+                profiler.add("draw:" + (key[0] if isinstance(key, tuple) else key), clock() - start)
+
+    def _present(self, draw_start, regions):
+        """Pushes the frame (or just regions) to the display, timing both halves."""
+        present_start = time.perf_counter()
+        if regions is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(regions)
+        if self.profiler is not None:
+            self.profiler.add("draw", present_start - draw_start, draw_start)
+            self.profiler.add("present", time.perf_counter() - present_start, present_start)
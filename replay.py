@@ -0,0 +1,214 @@
+import argparse
+import importlib
+import struct
+import sys
+import zlib
+
+from camera import MAX_ARRAY_SIZE
+from simulation import InputState, Simulator
+
+# --- Input Recording and Replay ---
+# A session is fully determined by the game's RNG seed, its array size and
+# the InputState of every tick, so that is all a log stores. The format is
+# a fixed header followed by run-length encoded ticks, each run being the
+# held/pressed controls packed into one byte plus how many ticks in a row
+# they stayed the same. A clean exit appends a trailer with the final tick
+# count and a digest of the game state, which replays are checked against.
+#
+#   python replay.py session.srlog ...   # re-verify logs headlessly
+
+MAGIC = b"SRTL"
+VERSION = 1
+HEADER = struct.Struct("<4sB16sQIH") # magic, version, game, seed, size, tick rate
+RUN = struct.Struct("<BH") # input bits, tick count
+TRAILER = struct.Struct("<QIB") # ticks, state digest, finished
+END_OF_RUNS = 0xFF # Input bits that can't occur, marking the trailer
+MAX_RUN = 0xFFFF
+FLUSH_TICKS = 60 # Push the pending run to disk about once a second at 60 ticks/s
+MAX_SEED = 2 ** 64 - 1 # Largest seed the header's "Q" field holds
+
+# Which module and class play each kind of log, and the player's attribute.
+GAMES = {
+    "gnome": ("gnome_sorter_game", "GnomeSortGame", "gnome"),
+    "selection": ("insertionsort", "SelectionSortGame", "sorter"),
+}
+
+
+def encode_input(inputs):
+    """Packs an InputState into one byte, one bit per control."""
+    bits = 0
+    for bit, name in enumerate(InputState.__slots__):
+        if getattr(inputs, name):
+            bits |= 1 << bit
+    return bits
+
+
+def decode_input(bits):
+    return InputState(*(bool(bits & (1 << bit)) for bit in range(len(InputState.__slots__))))
+
+
+def state_digest(game, actor):
+    """A checksum of everything a replay has to reproduce exactly."""
+    player = getattr(game, actor)
+    state = (game.ticks, game.state, game.objective, list(game.array_to_sort), round(player.x, 3), round(player.y, 3))
+    return zlib.crc32(repr(state).encode())
+
+
+def game_module(name):
+    return importlib.import_module(GAMES[name][0])
+
+
+def game_class(name):
+    return getattr(game_module(name), GAMES[name][1])
+
+
+class InputRecorder:
+    """Streams the input of every tick to a log file as the game runs.
+
+    Runs are written as soon as the input changes, and at least every
+    FLUSH_TICKS ticks, so a log survives the game crashing mid-session.
+    """
+    def __init__(self, path, game_name, seed, size, tick_rate):
+        if game_name not in GAMES:
+            raise ValueError(f"unknown game {game_name!r}")
+        self.game_name = game_name
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, game_name.encode(), seed, size, tick_rate))
+        self.ticks = 0
+        self._bits = None
+        self._count = 0
+
+    def record(self, inputs):
+        bits = encode_input(inputs)
+        if bits != self._bits or self._count == MAX_RUN:
+            self._write_run()
+            self._bits = bits
+        self._count += 1
+        self.ticks += 1
+        if self.ticks % FLUSH_TICKS == 0:
+            self._write_run()
+            self.file.flush()
+
+    def _write_run(self):
+        if self._count:
+            self.file.write(RUN.pack(self._bits, self._count))
+            self._count = 0
+
+    def close(self, game=None):
+        """Finishes the log; pass the game to record its final state for verification."""
+        if self.file.closed:
+            return
+        self._write_run()
+        if game is not None:
+            self.file.write(RUN.pack(END_OF_RUNS, 0))
+            self.file.write(TRAILER.pack(self.ticks, state_digest(game, GAMES[self.game_name][2]), game.finished))
+        self.file.close()
+
+
+class InputLog:
+    """A recorded session, loaded from disk."""
+    def __init__(self, game_name, seed, size, tick_rate, runs, result=None):
+        self.game_name = game_name
+        self.seed = seed
+        self.size = size
+        self.tick_rate = tick_rate
+        self.runs = runs # [(input bits, tick count)]
+        self.result = result # (ticks, digest, finished), or None if the session didn't exit cleanly
+        self.ticks = sum(count for _, count in runs)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError("too short to be an input log")
+        magic, version, game_name, seed, size, tick_rate = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not an input log")
+        if version != VERSION:
+            raise ValueError(f"log version {version} is not supported (expected {VERSION})")
+        game_name = game_name.rstrip(b"\0").decode(errors="replace")
+        if game_name not in GAMES:
+            raise ValueError(f"unknown game {game_name!r}")
+
+        runs = []
+        result = None
+        offset = HEADER.size
+        # A crash can leave a partial run at the end; whole runs are still usable.
+        while offset + RUN.size <= len(data):
+            bits, count = RUN.unpack_from(data, offset)
+            offset += RUN.size
+            if bits == END_OF_RUNS:
+                if offset + TRAILER.size <= len(data):
+                    ticks, digest, finished = TRAILER.unpack_from(data, offset)
+                    result = (ticks, digest, bool(finished))
+                break
+            runs.append((bits, count))
+        return cls(game_name, seed, size, tick_rate, runs, result)
+
+    def check_compatible(self, game_name, tick_rate):
+        """Raises ValueError if this log can't be replayed by the given game."""
+        if self.game_name != game_name:
+            raise ValueError(f"this is a {self.game_name} log, not {game_name}")
+        if self.tick_rate != tick_rate:
+            raise ValueError(f"log was recorded at {self.tick_rate} ticks/s, the game runs at {tick_rate}")
+        if not 2 <= self.size <= MAX_ARRAY_SIZE:
+            raise ValueError(f"array size {self.size} is out of range (2-{MAX_ARRAY_SIZE})")
+
+    def inputs(self):
+        """Yields the recorded InputState of every tick, in order."""
+        decoded = {}
+        for bits, count in self.runs:
+            inputs = decoded.get(bits)
+            if inputs is None:
+                inputs = decoded[bits] = decode_input(bits)
+            for _ in range(count):
+                yield inputs
+
+    def new_game(self):
+        return game_class(self.game_name)(seed=self.seed, size=self.size)
+
+
+def replay_headless(log):
+    """Plays the whole log back with no window, as fast as possible; returns the game."""
+    game = log.new_game()
+    Simulator(game, script=log.inputs()).advance(log.ticks)
+    return game
+
+
+def verify(log):
+    """Replays a log and compares the outcome to its trailer.
+
+    Returns (ok, description); logs without a trailer only check that they
+    replay at all. Raises ValueError if the log's game can't replay it.
+    """
+    log.check_compatible(log.game_name, game_module(log.game_name).TICK_RATE)
+    game = replay_headless(log)
+    summary = f"{log.game_name} seed={log.seed} size={log.size}: {log.ticks} ticks, {game.state}"
+    if log.result is None:
+        return True, summary + " (no recorded result to compare)"
+    ticks, digest, finished = log.result
+    if ticks != log.ticks or digest != state_digest(game, GAMES[log.game_name][2]) or finished != game.finished:
+        return False, summary + " - MISMATCH with recorded result"
+    return True, summary + " - matches recording"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-verify recorded sessions by replaying them headlessly.")
+    parser.add_argument("logs", nargs="+", metavar="LOG", help="input logs written with --record")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.logs:
+        try:
+            ok, description = verify(InputLog.load(path))
+        except (OSError, ValueError, struct.error) as e:
+            ok, description = False, str(e)
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {path}: {description}")
+    print(f"{len(args.logs) - failures}/{len(args.logs)} sessions replayed identically")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# --- Timers & Tweens ---
+# Anything that should happen "in a moment" (a pause to show a swap, a block
+# sliding into its new slot) is scheduled here instead of blocking the main
+# loop. The games advance their scheduler by one tick's worth of simulated
+# time per step, so animations stay deterministic when run headlessly.
+
+# Slack for float drift when summing fractional tick lengths (1000/60 ms)
+EPSILON_MS = 1e-6
+
+
+def linear(t):
+    return t
+
+
+def ease_in_out(t):
+    """Smoothstep easing: slow start, fast middle, slow finish."""
+    return t * t * (3 - 2 * t)
+
+
+class Timer:
+    """Calls callback once, delay_ms after it was scheduled."""
+    cancelled = False
+
+    def __init__(self, due, callback):
+        self.due = due
+        self.callback = callback
+
+    def advance(self, now):
+        if now + EPSILON_MS < self.due:
+            return False
+        self.callback()
+        return True
+
+
+class Tween:
+    """Moves target.attr from start to end over duration_ms."""
+    cancelled = False
+
+    def __init__(self, target, attr, start, end, begin, duration, easing, on_done):
+        self.target = target
+        self.attr = attr
+        self.start = start
+        self.end = end
+        self.begin = begin
+        self.duration = duration
+        self.easing = easing
+        self.on_done = on_done
+        setattr(target, attr, start)
+
+    def advance(self, now):
+        t = (now + EPSILON_MS - self.begin) / self.duration if self.duration > 0 else 1.0
+        if t >= 1.0:
+            setattr(self.target, self.attr, self.end)
+            if self.on_done is not None:
+                self.on_done()
+            return True
+        setattr(self.target, self.attr, self.start + (self.end - self.start) * self.easing(t))
+        return False
+
+
+class Scheduler:
+    """Runs timers and tweens against a clock advanced by update(dt_ms)."""
+    def __init__(self):
+        self.now = 0.0
+        self._tasks = []
+        self._cleared = False
+
+    @property
+    def busy(self):
+        """True while any timer or tween is still pending."""
+        return bool(self._tasks)
+
+    def after(self, delay_ms, callback):
+        """Schedules callback to run once delay_ms from now."""
+        task = Timer(self.now + delay_ms, callback)
+        self._tasks.append(task)
+        return task
+
+    def tween(self, target, attr, start, end, duration_ms, easing=ease_in_out, on_done=None):
+        """Animates a numeric attribute; on_done runs once it reaches end."""
+        task = Tween(target, attr, start, end, self.now, duration_ms, easing, on_done)
+        self._tasks.append(task)
+        return task
+
+    def cancel(self, task):
+        """Stops a pending task; cancelling a finished task is a no-op."""
+        task.cancelled = True
+        if task in self._tasks:
+            self._tasks.remove(task)
+
+    def clear(self):
+        """Drops every pending task without running it."""
+        self._tasks = []
+        self._cleared = True
+
+    def update(self, dt_ms):
+        """Advances the clock and runs whatever became due, in schedule order.
+
+        Tasks scheduled by a callback are first advanced on the next update.
+        If a callback calls clear(), the rest of this batch is dropped too.
+        """
+        self.now += dt_ms
+        pending = self._tasks
+        self._tasks = []
+        self._cleared = False
+        survivors = []
+        for task in pending:
+            if self._cleared:
+                break
+            if task.cancelled:
+                continue
+            if not task.advance(self.now):
+                survivors.append(task)
+        if not self._cleared:
+            self._tasks = survivors + self._tasks
+        return self.busy
@@ -0,0 +1,146 @@
+import pygame
+
+# --- Headless Simulation ---
+# The games expose their state machines as plain objects with a step(inputs)
+# method. Nothing in a step touches the display or the frame clock, so the
+# Simulator below can play games back-to-back as fast as the CPU allows.
+
+
+class InputState:
+    """The controls seen by a game during a single tick."""
+    __slots__ = ("left", "right", "up", "down", "space", "reset")
+
+    def __init__(self, left=False, right=False, up=False, down=False, space=False, reset=False):
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+        self.space = space  # SPACE was pressed this tick
+        self.reset = reset  # R was pressed this tick
+
+    def __repr__(self):
+        held = [name for name in self.__slots__ if getattr(self, name)]
+        return f"InputState({', '.join(held)})"
+
+
+IDLE_INPUT = InputState()
+
+
+def read_input(events):
+    """Builds an InputState from this frame's pygame events and the held keys."""
+    inputs = InputState()
+    for event in events:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                inputs.reset = True
+            if event.key == pygame.K_SPACE:
+                inputs.space = True
+
+    keys = pygame.key.get_pressed()
+    inputs.left = bool(keys[pygame.K_LEFT] or keys[pygame.K_a])
+    inputs.right = bool(keys[pygame.K_RIGHT] or keys[pygame.K_d])
+    inputs.up = bool(keys[pygame.K_UP] or keys[pygame.K_w])
+    inputs.down = bool(keys[pygame.K_DOWN] or keys[pygame.K_s])
+    return inputs
+
+
+class Simulator:
+    """Drives a game state machine without a window or frame pacing.
+
+    Inputs come either from a script (any iterable of InputState, one per
+    tick, idling once it runs out) or from a policy callable that is handed
+    the game and returns the InputState for the next tick.
+    """
+    def __init__(self, game, script=(), policy=None):
+        self.game = game
+        self.script = iter(script)
+        self.policy = policy
+        self.ticks = 0
+
+    def next_input(self):
+        """Returns the input for the upcoming tick."""
+        if self.policy is not None:
+            return self.policy(self.game)
+        return next(self.script, IDLE_INPUT)
+
+    def advance(self, ticks=1):
+        """Runs the given number of ticks back-to-back and returns the game."""
+        for _ in range(ticks):
+            self.game.step(self.next_input())
+        self.ticks += ticks
+        return self.game
+
+    def run_until_finished(self, max_ticks):
+        """Steps until the game reports it is finished or max_ticks is reached.
+
+        Returns the number of ticks simulated by this call.
+        """
+        start = self.ticks
+        while not self.game.finished and self.ticks - start < max_ticks:
+            self.game.step(self.next_input())
+            self.ticks += 1
+        return self.ticks - start
+
+
+class FixedStepDriver:
+    """Steps a game at a fixed tick length, independent of the render rate.
+
+    Each rendered frame hands over the wall-clock time since the previous
+    frame. Whole ticks are taken out of an accumulator and the remainder is
+    exposed as `alpha`, the fraction of the way from the last simulated
+    state to the next, for interpolating what is drawn. SPACE/R presses seen
+    on a frame that runs no tick are held over until one does, so fast
+    renderers never drop input.
+
+    Given a `script` (an iterable of InputState, as for Simulator) the
+    ticks take their input from it instead of the frame's, idling once it
+    runs out. A `recorder` is handed the input of every tick that runs.
+    """
+    def __init__(self, game, step_ms, max_steps_per_frame=5, script=None, recorder=None):
+        self.game = game
+        self.step_ms = step_ms
+        self.max_steps_per_frame = max_steps_per_frame
+        self.script = iter(script) if script is not None else None
+        self.recorder = recorder
+        self.accumulator = 0.0
+        self._space = False
+        self._reset = False
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_ms
+
+    @property
+    def pending_input(self):
+        """True if a SPACE/R press is waiting for the next tick."""
+        return self._space or self._reset
+
+    def update(self, elapsed_ms, inputs):
+        """Runs as many ticks as elapsed_ms covers; returns how many ran."""
+        self._space = self._space or inputs.space
+        self._reset = self._reset or inputs.reset
+        self.accumulator += elapsed_ms
+
+        steps = 0
+        while self.accumulator >= self.step_ms and steps < self.max_steps_per_frame:
+            if self.script is not None:
+                tick_inputs = next(self.script, IDLE_INPUT)
+            else:
+                tick_inputs = InputState(inputs.left, inputs.right, inputs.up, inputs.down,
+                                         space=self._space, reset=self._reset)
+            if self.recorder is not None:
+                self.recorder.record(tick_inputs)
+            self.game.step(tick_inputs)
+            self._space = self._reset = False
+            self.accumulator -= self.step_ms
+            steps += 1
+
+        # If the machine can't keep up, slow the game down rather than
+        # trying to catch up with ever longer bursts of ticks.
+        if steps == self.max_steps_per_frame:
+            self.accumulator = min(self.accumulator, self.step_ms)
+        return steps
+
+
+def lerp(previous, current, alpha):
+    return previous + (current - previous) * alpha
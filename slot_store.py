@@ -0,0 +1,133 @@
+import math
+from array import array
+
+# --- Struct-of-Arrays Slot Storage ---
+# Pots and blocks sit in one evenly spaced row, so rather than one Python
+# object per element the row keeps flat typed arrays indexed by slot.
+# FlowerPot and DataBlock are small __slots__ handles over a slot, made on
+# demand when something needs an object to hold on to; bulk work (layout,
+# culling, proximity queries) runs over the arrays directly.
+
+
+class SlotStore:
+    """Values and positions of a row of slots, one array entry per slot.
+
+    `value` is the array being sorted; the games expose it as their
+    array_to_sort, so a swap writes each value once. `x` holds each slot's
+    world x and `y` is shared by the whole row. Drawing offsets and ghost
+    flags only ever apply to a couple of slots at a time, so they are kept
+    sparse. Indexing the store returns a handle_class handle.
+    """
+    def __init__(self, handle_class, values, spacing, y):
+        self.handle_class = handle_class
+        self.value = array("q", values)
+        self.y = y
+        self.offsets = {} # slot -> drawing-only x displacement while animating
+        self.ghosts = set() # Slots whose element is being carried
+        self.relayout(spacing)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self.value):
+            if not -len(self.value) <= i < 0:
+                raise IndexError("slot index out of range")
+            i += len(self.value)
+        return self.handle_class(self, i)
+
+    def __iter__(self):
+        for i in range(len(self.value)):
+            yield self.handle_class(self, i)
+
+    def relayout(self, spacing):
+        """Recomputes every slot's x for a new spacing."""
+        self.spacing = spacing
+        count = len(self.value)
+        if spacing == int(spacing):
+            # Whole-pixel spacing: the positions are an arithmetic sequence
+            step = int(spacing)
+            self.x = array("q", range(step, step * (count + 1), step))
+        else:
+            self.x = array("q", [int(spacing * (i + 1)) for i in range(count)])
+
+    def nearest(self, x, y, radius):
+        """Returns the handle of the closest slot strictly within radius of (x, y), or None.
+
+        Only the slots whose x could be in range are checked, so this costs
+        O(radius / spacing) however long the row is. Ties go to the lower slot.
+        """
+        xs = self.x
+        first = max(0, math.floor((x - radius) / self.spacing) - 1)
+        last = min(len(xs), math.ceil((x + radius) / self.spacing) + 1)
+        best, best_dist = None, radius
+        dy = y - self.y
+        for i in range(first, last):
+            dist = math.hypot(x - xs[i], dy)
+            if dist < best_dist:
+                best, best_dist = i, dist
+        return None if best is None else self.handle_class(self, best)
+
+    def nbytes(self):
+        """Approximate bytes held by the per-slot arrays."""
+        return self.value.itemsize * len(self.value) + self.x.itemsize * len(self.x)
+
+
+class SlotHandle:
+    """A lightweight reference to one slot of a SlotStore.
+
+    Handles compare equal when they refer to the same slot, so a fresh
+    handle can stand in for one obtained earlier.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, SlotHandle) and self.store is other.store and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(index={self.index}, value={self.value})"
+
+    @property
+    def value(self):
+        return self.store.value[self.index]
+
+    @value.setter
+    def value(self, value):
+        self.store.value[self.index] = value
+
+    @property
+    def x(self):
+        return self.store.x[self.index]
+
+    @property
+    def y(self):
+        return self.store.y
+
+    @property
+    def offset_x(self):
+        return self.store.offsets.get(self.index, 0.0)
+
+    @offset_x.setter
+    def offset_x(self, offset):
+        if offset:
+            self.store.offsets[self.index] = offset
+        else:
+            self.store.offsets.pop(self.index, None)
+
+    @property
+    def is_ghost(self):
+        return self.index in self.store.ghosts
+
+    @is_ghost.setter
+    def is_ghost(self, ghost):
+        if ghost:
+            self.store.ghosts.add(self.index)
+        else:
+            self.store.ghosts.discard(self.index)
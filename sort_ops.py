@@ -0,0 +1,152 @@
+import time
+from collections import deque
+from itertools import islice
+
+# --- Auto-Play ---
+# In auto-play the sort runs by itself. Each algorithm is a generator that
+# sorts the game's array in place and yields every comparison and swap as
+# it makes it, so operations are only produced as fast as they are
+# consumed and the stream never exists in memory as a whole. Each frame the
+# AutoPlayer pulls as many operations as its per-frame count and time
+# budget allow, then lets the game show where the sort has got to.
+
+COMPARE = "compare"
+SWAP = "swap"
+BUDGET_CHECK_OPS = 256 # Operations between looks at the clock
+STATUS_REFRESH_MS = 250 # How often the counters in the objective text update
+RATE_WINDOW_S = 1.0 # Operations per second are averaged over this long
+
+
+def gnome_sort_ops(array):
+    """Gnome-sorts array in place, yielding (COMPARE, i - 1, i) and (SWAP, i - 1, i)."""
+    i = 1
+    while i < len(array):
+        yield (COMPARE, i - 1, i)
+        if array[i] < array[i - 1]:
+            array[i], array[i - 1] = array[i - 1], array[i]
+            yield (SWAP, i - 1, i)
+            i = max(1, i - 1)
+        else:
+            i += 1
+
+
+def selection_sort_ops(array):
+    """Selection-sorts array in place, yielding (COMPARE, min, j) and (SWAP, pass, min).
+
+    Every pass ends in exactly one swap, a no-op when the minimum is
+    already in place, so the swap count is also the number of passes done.
+    """
+    count = len(array)
+    for i in range(count - 1):
+        smallest = i
+        for j in range(i + 1, count):
+            yield (COMPARE, smallest, j)
+            if array[j] < array[smallest]:
+                smallest = j
+        array[i], array[smallest] = array[smallest], array[i]
+        yield (SWAP, i, smallest)
+
+
+class AutoPlayer:
+    """Drives a game's sort from its operation stream, a bounded slice per frame.
+
+    The game provides auto_ops(), returning a fresh stream for its current
+    array, and show_auto(player), which updates highlights, the player
+    sprite and the objective from `last_op`, the counters and `status`.
+    """
+    def __init__(self, game, ops_per_frame=1, budget_ms=8.0):
+        self.game = game
+        self.ops_per_frame = ops_per_frame
+        self.budget_ms = budget_ms
+        self.restart()
+
+    def restart(self):
+        """Starts over on the game's current array."""
+        self.ops = self.game.auto_ops()
+        self.comparisons = 0
+        self.swaps = 0
+        self.last_op = None
+        self.finished = False
+        self.paused = False
+        self.ops_per_second = 0.0
+        self.status = ""
+        self._history = deque() # (time, operations) over the last RATE_WINDOW_S
+        self._status_time = None
+        self._update_status(time.perf_counter())
+        self.game.show_auto(self)
+
+    @property
+    def operations(self):
+        return self.comparisons + self.swaps
+
+    @property
+    def idle(self):
+        """True when frames would show nothing new."""
+        return self.paused or self.finished
+
+    def handle(self, inputs):
+        """SPACE pauses and resumes; R, or SPACE once sorted, starts over on a new array."""
+        if inputs.reset or (inputs.space and self.finished):
+            self.game.reset()
+            self.restart()
+        elif inputs.space:
+            self.paused = not self.paused
+            self._status_time = None
+
+    def scale_speed(self, factor):
+        self.ops_per_frame = max(1, int(self.ops_per_frame * factor))
+        self._status_time = None
+
+    def run_frame(self):
+        """Consumes up to ops_per_frame operations, stopping early once budget_ms is spent."""
+        now = time.perf_counter()
+        if not self.idle:
+            deadline = now + self.budget_ms / 1000
+            remaining = self.ops_per_frame
+            done = swaps = 0
+            op = self.last_op
+            while remaining > 0:
+                chunk = min(remaining, BUDGET_CHECK_OPS)
+                taken = 0
+                for op in islice(self.ops, chunk):
+                    if op[0] == SWAP:
+                        swaps += 1
+                    taken += 1
+                done += taken
+                if taken < chunk:
+                    self.finished = True
+                    break
+                remaining -= chunk
+                if time.perf_counter() >= deadline:
+                    break
+            self.last_op = op
+            self.swaps += swaps
+            self.comparisons += done - swaps
+            now = time.perf_counter()
+        self._update_status(now)
+        self.game.show_auto(self)
+
+    def _update_status(self, now):
+        history = self._history
+        history.append((now, self.operations))
+        while now - history[0][0] > RATE_WINDOW_S:
+            history.popleft()
+        elapsed = now - history[0][0]
+        if self.idle:
+            self.ops_per_second = 0.0
+        elif elapsed > 0:
+            self.ops_per_second = (self.operations - history[0][1]) / elapsed
+
+        # Rewritten a few times a second, so it stays readable and the text
+        # cache isn't flooded with one-off strings
+        if self._status_time is not None and not self.finished and now - self._status_time < STATUS_REFRESH_MS / 1000:
+            return
+        self._status_time = now
+        if self.finished:
+            self.status = (f"Sorted with {self.comparisons:,} comparisons and {self.swaps:,} swaps! "
+                           f"SPACE or R to sort a new array.")
+        elif self.paused:
+            self.status = f"Auto-play paused at {self.comparisons:,} comparisons, {self.swaps:,} swaps. SPACE resumes."
+        else:
+            self.status = (f"Auto-play: {self.comparisons:,} comparisons, {self.swaps:,} swaps, "
+                           f"{self.ops_per_second:,.0f} ops/s ({self.ops_per_frame:,}/frame, [ ] to change)")
@@ -0,0 +1,52 @@
+import threading
+
+import pygame
+
+# --- Startup ---
+# pygame.init() brings up every subsystem, including audio and joysticks,
+# which these games never use and which can stall on device probing. The
+# games only need the display (which also provides the event queue and the
+# keyboard state) and the font renderer. Fonts can load on a background
+# thread while the window is being created.
+
+
+def init_subsystems():
+    """Initializes only the pygame subsystems the games use."""
+    pygame.display.init() # Display, event queue and keyboard
+    pygame.font.init()
+
+
+class FontLoader:
+    """Loads pygame's default font at several sizes, off the main thread.
+
+    get(size) returns the font, waiting for the background load if it is
+    still running; sizes that were never requested up front are loaded on
+    first use.
+    """
+    def __init__(self, sizes=(), background=True):
+        self._fonts = {}
+        self._thread = None
+        if background and sizes:
+            self._thread = threading.Thread(target=self._load, args=(sizes,), name="font-loader", daemon=True)
+            self._thread.start()
+        else:
+            self._load(sizes)
+
+    def _load(self, sizes):
+        for size in sizes:
+            self._fonts[size] = pygame.font.Font(None, size)
+
+    def wait(self):
+        """Blocks until the background load (if any) has finished."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            self.wait()
+            font = self._fonts.get(size)
+            if font is None:
+                font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
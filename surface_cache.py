@@ -0,0 +1,132 @@
+import pygame
+from collections import OrderedDict
+
+# --- Surface Caches ---
+# Rasterizing text is the most expensive thing the games do per frame, and
+# nearly every string drawn (titles, pot values, HUD labels) is identical to
+# the one drawn the frame before. The caches here keep the rendered surfaces
+# around so a frame is mostly blits.
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces.
+
+    Entries are keyed by (font, text, antialias, color). Cached surfaces are
+    shared, so callers must only blit them, never draw onto them.
+    """
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias, color):
+        """Drop-in replacement for font.render() that reuses earlier results."""
+        key = (font, text, antialias, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def invalidate(self, font=None):
+        """Drops every entry rendered with font, or everything if font is None.
+
+        Call this when a font is reloaded so stale glyphs are not reused.
+        """
+        if font is None:
+            self._surfaces.clear()
+            return
+        for key in [key for key in self._surfaces if key[0] is font]:
+            del self._surfaces[key]
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Returns the counters as a dict, e.g. for logging."""
+        return {
+            "size": len(self._surfaces),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+# Shared by both games; sized to hold every pot value, HUD label and
+# objective string with plenty of headroom.
+text_cache = TextCache()
+
+
+class OverlayCache:
+    """Pre-rendered translucent overlay surfaces, built once per shape.
+
+    Highlights and zone tints are keyed by their size and color, so a new
+    surface is only built the first time a combination is seen (or after a
+    resize changes the size). Every other frame reuses the stored surface.
+    """
+    def __init__(self):
+        self._surfaces = {}
+        self.builds = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def _new_surface(self, key):
+        surface = pygame.Surface(key[1], pygame.SRCALPHA)
+        self._surfaces[key] = surface
+        self.builds += 1
+        return surface
+
+    def circle(self, radius, color):
+        """A filled circle of the given radius on a (2r x 2r) surface."""
+        key = ("circle", (radius * 2, radius * 2), tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._new_surface(key)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+        return surface
+
+    def rounded_rect(self, size, color, border_radius=0):
+        """A filled rectangle with rounded corners covering the whole surface."""
+        key = ("rect", (int(size[0]), int(size[1])), tuple(color), border_radius)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._new_surface(key)
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        return surface
+
+    def fill(self, size, color):
+        """A surface flood-filled with color.
+
+        Blit it with an `area` rect to tint any smaller region without
+        allocating a surface for that exact size.
+        """
+        key = ("fill", (int(size[0]), int(size[1])), tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._new_surface(key)
+            surface.fill(color)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+overlay_cache = OverlayCache()
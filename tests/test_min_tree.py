@@ -0,0 +1,65 @@
+import random
+
+from min_tree import MinSegmentTree
+
+
+def scan_argmin(array, lo):
+    """The left-to-right scan the tree replaced; ties keep the first index."""
+    best = -1
+    for i in range(lo, len(array)):
+        if best < 0 or array[i] < array[best]:
+            best = i
+    return best
+
+
+def test_matches_scan_with_duplicates():
+    rng = random.Random(0)
+    for total in (1, 2, 3, 7, 8, 9, 100):
+        array = [rng.randrange(4) for _ in range(total)]
+        tree = MinSegmentTree(array)
+        for lo in range(total + 1):
+            assert tree.argmin(lo) == scan_argmin(array, lo), (array, lo)
+
+
+def test_ties_resolve_to_lowest_index():
+    array = [5, 2, 9, 2, 2]
+    tree = MinSegmentTree(array)
+    assert tree.argmin() == 1
+    assert tree.argmin(2) == 3
+    assert tree.argmin(4) == 4
+
+
+def test_update_after_swaps_matches_selection_sort():
+    rng = random.Random(1)
+    for total in (2, 5, 16, 33, 200):
+        array = [rng.randrange(total // 2 + 1) for _ in range(total)]
+        scanned = list(array)
+        tree = MinSegmentTree(array)
+        for start in range(total - 1):
+            expected = scan_argmin(scanned, start)
+            assert tree.argmin(start) == expected
+            scanned[start], scanned[expected] = scanned[expected], scanned[start]
+            array[start], array[expected] = array[expected], array[start]
+            tree.update(start)
+            tree.update(expected)
+        assert array == sorted(array)
+
+
+def test_update_after_changing_a_value():
+    array = [4, 3, 2, 1]
+    tree = MinSegmentTree(array)
+    array[0] = 0
+    tree.update(0)
+    assert tree.argmin() == 0
+    assert tree.argmin(1) == 3
+
+
+def test_empty_and_single_element_suffixes():
+    array = [3, 1, 2]
+    tree = MinSegmentTree(array)
+    assert tree.argmin(2) == 2
+    assert tree.argmin(3) == -1
+    assert tree.argmin(1, 1) == -1
+    assert MinSegmentTree([7]).argmin() == 0
+    assert MinSegmentTree([7]).argmin(1) == -1
+    assert MinSegmentTree([]).argmin() == -1
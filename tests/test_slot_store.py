@@ -0,0 +1,50 @@
+import math
+import random
+
+from slot_store import SlotHandle, SlotStore
+
+
+class Slot(SlotHandle):
+    __slots__ = ()
+
+
+def nearest_brute_force(store, x, y, radius):
+    """Linear-scan reference: the closest slot strictly within radius, lowest index on ties."""
+    best, best_dist = None, radius
+    for slot in store:
+        dist = math.hypot(x - slot.x, y - slot.y)
+        if dist < best_dist:
+            best, best_dist = slot, dist
+    return best
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(0)
+    for total, spacing in ((1, 90), (10, 90), (200, 92.3), (1000, 100)):
+        store = SlotStore(Slot, range(total), spacing, 350)
+        world_width = spacing * (total + 1)
+        for _ in range(500):
+            x, y = rng.uniform(-50, world_width + 50), 350 + rng.uniform(-80, 80)
+            radius = rng.choice((10, 55, 90, 200))
+            assert store.nearest(x, y, radius) == nearest_brute_force(store, x, y, radius), (total, x, y, radius)
+
+
+def test_nearest_radius_is_exclusive_and_ties_go_low():
+    store = SlotStore(Slot, [5, 6, 7], 100, 0)
+    assert store.nearest(100, 0, 1).index == 0
+    assert store.nearest(100, 55, 55) is None
+    assert store.nearest(150, 0, 60).index == 0 # Halfway between slots 0 and 1
+    assert store.nearest(1000, 0, 55) is None
+
+
+def test_handles_read_and_write_the_rows():
+    store = SlotStore(Slot, [3, 1, 2], 90, 350)
+    slot = store[1]
+    assert (slot.value, slot.x, slot.y) == (1, 180, 350)
+    store.value[0], store.value[1] = store.value[1], store.value[0]
+    assert slot.value == 3
+    assert store[-1] == store[2] and store[2] != store[1]
+    slot.offset_x = 12.5
+    assert store.offsets == {1: 12.5}
+    slot.offset_x = 0.0
+    assert store.offsets == {}